@@ -164,11 +164,14 @@ class PagerAmp:
             # Menu overlay takes priority
             if self.menu_active:
                 result = self.menu.handle_input(button, event_type, self.pager)
-                if result == "close_menu":
-                    self.menu_active = False
-                elif result:
+                if result:
                     self.menu_active = False
-                    self._handle_screen_result(result)
+                    # Repaint whatever the overlay was covering
+                    screen = self.screens.get(self.current_screen)
+                    if hasattr(screen, "invalidate"):
+                        screen.invalidate()
+                    if result != "close_menu":
+                        self._handle_screen_result(result)
                 continue
 
             # Dispatch to current screen
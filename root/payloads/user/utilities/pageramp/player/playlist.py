@@ -22,11 +22,13 @@ class Playlist:
         self.position = 0       # current index in order
         self.shuffle = False
         self.repeat = self.REPEAT_OFF
+        self.version = 0        # bumped whenever tracks or order change
 
     def clear(self):
         self.tracks = []
         self.order = []
         self.position = 0
+        self.version += 1
 
     def load_m3u(self, path):
         """Load playlist from .m3u file."""
@@ -44,6 +46,7 @@ class Playlist:
                     if os.path.isfile(line):
                         self.tracks.append(line)
         except (IOError, OSError):
+            self.version += 1
             return False
         self._rebuild_order()
         return len(self.tracks) > 0
@@ -54,6 +57,7 @@ class Playlist:
             path = MUSIC_DIR
         self.tracks = []
         if not os.path.isdir(path):
+            self.version += 1
             return False
         for name in sorted(os.listdir(path)):
             if name.lower().endswith(SUPPORTED_EXT):
@@ -70,6 +74,7 @@ class Playlist:
         """Add a track to the end."""
         self.tracks.append(path)
         self.order.append(len(self.tracks) - 1)
+        self.version += 1
 
     def _rebuild_order(self):
         """Rebuild playback order based on shuffle setting."""
@@ -77,6 +82,7 @@ class Playlist:
         if self.shuffle:
             random.shuffle(self.order)
         self.position = 0
+        self.version += 1
 
     def set_shuffle(self, enabled):
         """Toggle shuffle, preserving current track if possible."""
@@ -6,10 +6,15 @@ States: CHECK_ADAPTER → SCAN → SELECT_DEVICE → PAIR → CONNECT → TEST 
 """
 
 import os
+import re
 import subprocess
+import threading
 import time
+from collections import OrderedDict
 
-from ui.widgets import FONT_PATH
+from ui.screens import BTN_UP, BTN_DOWN, BTN_A, BTN_B
+from ui.skin import color_id
+from ui.widgets import FONT_PATH, _fit_text
 
 SCREEN_W = 480
 SCREEN_H = 222
@@ -17,6 +22,9 @@ SCREEN_H = 222
 # BT adapter detection
 SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+# "Device <mac> <name>" lines from `bluetoothctl devices`
+_RE_DEVICE = re.compile(r"^Device[ \t]+(\S+)[ \t]+(.+)$", re.MULTILINE)
+
 
 class BluetoothScreen:
     """Bluetooth pairing wizard with graphical UI."""
@@ -42,6 +50,17 @@ class BluetoothScreen:
         "Error",
     ]
 
+    # Header text per state, built once instead of concatenated per frame
+    STATE_TITLES = ["Bluetooth: " + label for label in STATE_LABELS]
+
+    # Bottom hint bar text per state ("[B] Back" for anything else)
+    STATE_HINTS = {
+        SELECT_DEVICE: "[A] Select  [B] Back  [UP/DN] Navigate",
+        SCAN: "[A] Rescan  [B] Back",
+        ERROR: "[A] Retry  [B] Back",
+        DONE: "[A/B] Done",
+    }
+
     def __init__(self, settings):
         self.settings = settings
         self.state = self.CHECK_ADAPTER
@@ -56,11 +75,20 @@ class BluetoothScreen:
         self.font_size = 12
         self.line_height = 18
         self.visible_count = (SCREEN_H - 60) // self.line_height
-        self._scan_start = 0
+        self._scan_deadline = 0     # time.monotonic() when scan ends
         self._scan_duration = 12
-        self._pair_pending = None  # (mac, name) when pairing requested
-        self._pair_draw_wait = 0  # frames to wait before starting pair
+        self._scan_mode = None      # bluetoothctl scan argument, probed once
+        self._scan_last_remaining = None
+        self._scan_progress = 0.0   # 0.0-1.0, updated by _poll_scan()
+        self._pair_thread = None   # daemon thread running _pair_device()
+        self._pair_error = None    # exception raised by _pair_device()
+        self._pair_result = None   # (mac, name) staged with state=DONE
+        self._ui_lock = threading.Lock()
+        self._pending_ui = {}      # attribute writes staged by the worker
         self.return_screen = "settings"
+        self._colors = None         # element name → RGB565 for _colors_skin
+        self._colors_skin = None
+        self._handlers = self._build_handlers()
 
     def enter(self):
         """Called when screen becomes active."""
@@ -70,6 +98,27 @@ class BluetoothScreen:
         self.error_msg = ""
         self._check_adapter()
 
+    def _set_ui(self, **fields):
+        """Stage state/message writes from the pairing worker thread.
+
+        The UI thread applies them in update() so draw() never sees a
+        state from one step paired with the message from another.
+        """
+        with self._ui_lock:
+            self._pending_ui.update(fields)
+
+    def _apply_pending_ui(self):
+        """Apply attribute writes staged by _set_ui() (UI thread only)."""
+        with self._ui_lock:
+            pending, self._pending_ui = self._pending_ui, {}
+        for attr, value in pending.items():
+            setattr(self, attr, value)
+        if self._pair_result:
+            mac, name = self._pair_result
+            self._pair_result = None
+            self.settings["bt_device_mac"] = mac
+            self.settings["bt_device_name"] = name
+
     def _run(self, cmd, timeout=10):
         """Run a shell command and return output."""
         try:
@@ -109,10 +158,11 @@ class BluetoothScreen:
                             self.adapter_mac = parts[idx + 1]
                         break
 
-                # 1. Bring adapter up (HCI level, no dbus needed)
-                self._run("hciconfig %s up" % hci)
-                self._run("hciconfig %s auth encrypt" % hci)
-                self._run('hciconfig %s name "Pineapple Pager"' % hci)
+                # 1. Bring adapter up (HCI level, no dbus needed) —
+                # one shell for all three instead of a fork per step
+                self._run('hciconfig %s up; hciconfig %s auth encrypt; '
+                          'hciconfig %s name "Pineapple Pager"'
+                          % (hci, hci, hci))
 
                 # 2. dbus-daemon + policy
                 self.message = "Starting Bluetooth services..."
@@ -200,74 +250,90 @@ class BluetoothScreen:
         )
         time.sleep(3)
 
+    def _get_scan_mode(self):
+        """Return the bluetoothctl scan argument for this BlueZ version.
+
+        BlueZ 5.65+ accepts "scan bredr", which skips the LE interleave
+        so classic A2DP speakers show up sooner. Older versions only
+        know "scan on".
+        """
+        if self._scan_mode is None:
+            self._scan_mode = "on"
+            out = self._run("bluetoothctl --version 2>/dev/null", timeout=3)
+            try:
+                version = tuple(int(p) for p in out.split()[-1].split("."))
+            except (IndexError, ValueError):
+                version = ()
+            if version >= (5, 65):
+                self._scan_mode = "bredr"
+        return self._scan_mode
+
     def _start_scan(self):
         """Begin scanning for Bluetooth devices.
 
-        Uses bluetoothctl scan on which discovers both BLE and BR/EDR
-        devices AND registers them with bluetoothd (required for
-        bluetoothctl pair/connect to work).
+        Uses bluetoothctl scan which discovers devices AND registers them
+        with bluetoothd (required for bluetoothctl pair/connect to work).
+        With a saved device the scan is shortened — that device is
+        almost always the one being reconnected, and [A] rescans.
         """
         self.message = "Scanning... Put device in pairing mode!"
         self.devices = []
-        self._scan_start = time.time()
+        self._scan_duration = 6 if self.settings.get("bt_device_mac") else 12
+        self._scan_deadline = time.monotonic() + self._scan_duration
+        self._scan_last_remaining = None
+        self._scan_progress = 0.0
 
-        # bluetoothctl scan on — registers devices with bluetoothd
+        # bluetoothctl scan — registers devices with bluetoothd
         subprocess.Popen(
-            "timeout %d bluetoothctl scan on >/dev/null 2>&1"
-            % self._scan_duration,
+            "timeout %d bluetoothctl scan %s >/dev/null 2>&1"
+            % (self._scan_duration, self._get_scan_mode()),
             shell=True,
         )
 
     def _poll_scan(self):
         """Check scan results when scan timer expires."""
-        elapsed = time.time() - self._scan_start
-        if elapsed < self._scan_duration:
-            self.message = "Scanning... %ds remaining" % int(
-                self._scan_duration - elapsed)
+        left = self._scan_deadline - time.monotonic()
+        if left > 0:
+            self._scan_progress = 1.0 - left / self._scan_duration
+            # Only reformat the message when the whole-second count changes
+            remaining = int(left)
+            if remaining != self._scan_last_remaining:
+                self._scan_last_remaining = remaining
+                self.message = "Scanning... %ds remaining" % remaining
             return
+        self._scan_progress = 1.0
 
-        self.devices = []
-        seen = set()
+        found = OrderedDict()  # mac → display name, first entry wins
 
         # 1. Paired devices first
         paired = self._run("bluetoothctl devices Paired 2>/dev/null")
-        for line in paired.split("\n"):
-            if line.startswith("Device "):
-                parts = line.split(None, 2)
-                if len(parts) >= 3:
-                    mac = parts[1]
-                    name = parts[2]
-                    if mac not in seen:
-                        self.devices.append((mac, name + " [paired]"))
-                        seen.add(mac)
+        for mac, name in _RE_DEVICE.findall(paired):
+            found.setdefault(mac, name + " [paired]")
 
         # 2. All discovered devices from bluetoothctl
         all_devs = self._run("bluetoothctl devices 2>/dev/null")
-        for line in all_devs.split("\n"):
-            if line.startswith("Device "):
-                parts = line.split(None, 2)
-                if len(parts) >= 3:
-                    mac = parts[1]
-                    name = parts[2]
-                    # Strip LE- prefix
-                    if name.startswith("LE-"):
-                        name = name[3:]
-                    # Skip unnamed, MAC-like, or too-short names
-                    # MAC pattern: XX:XX:XX:XX:XX:XX or XX-XX-XX-XX-XX-XX
-                    is_mac = (len(name) == 17 and
-                              (name.count(":") == 5 or name.count("-") == 5) and
-                              all(c in "0123456789ABCDEFabcdef:-"
-                                  for c in name))
-                    if (mac not in seen and name and
-                            not is_mac and len(name) >= 3):
-                        self.devices.append((mac, name))
-                        seen.add(mac)
-
-        # Saved device as fallback
+        for mac, name in _RE_DEVICE.findall(all_devs):
+            if mac in found:
+                continue
+            # Strip LE- prefix
+            if name.startswith("LE-"):
+                name = name[3:]
+            # Skip unnamed, MAC-like, or too-short names
+            # MAC pattern: XX:XX:XX:XX:XX:XX or XX-XX-XX-XX-XX-XX
+            is_mac = (len(name) == 17 and
+                      (name.count(":") == 5 or name.count("-") == 5) and
+                      all(c in "0123456789ABCDEFabcdef:-" for c in name))
+            if not is_mac and len(name) >= 3:
+                found[mac] = name
+
+        # Saved device as fallback, listed first
         saved = self.settings.get("bt_device_mac")
-        if saved and saved not in seen:
+        if saved and saved not in found:
             saved_name = self.settings.get("bt_device_name", "Saved Device")
-            self.devices.insert(0, (saved, saved_name + " [saved]"))
+            found[saved] = saved_name + " [saved]"
+            found.move_to_end(saved, last=False)
+
+        self.devices = list(found.items())
 
         if self.devices:
             self.state = self.SELECT_DEVICE
@@ -333,6 +399,17 @@ class BluetoothScreen:
         self._run("bluetoothctl disconnect %s" % mac, timeout=3)
         time.sleep(0.5)
         self._run("bluetoothctl remove %s" % mac, timeout=5)
+        # bluetoothd keeps cached SDP records for the device after remove;
+        # a stale cache makes the next pair fail with "Protocol not available"
+        if self.adapter_mac:
+            cache_path = "/var/lib/bluetooth/%s/cache/%s" % (
+                self.adapter_mac, mac)
+            try:
+                os.unlink(cache_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self._log("could not clear %s: %s" % (cache_path, e))
         time.sleep(1)
 
     def _pair_device(self, mac, name):
@@ -371,8 +448,8 @@ class BluetoothScreen:
 
         # ── Fast path: already paired → try connect ───────
         if already_paired:
-            self.state = self.CONNECT
-            self.message = "Connecting to %s..." % name
+            self._set_ui(state=self.CONNECT,
+                         message="Connecting to %s..." % name)
 
             connected, auth_fail = self._try_connect(mac)
             if connected:
@@ -386,8 +463,7 @@ class BluetoothScreen:
             # Fall through to fresh pair below
 
         # ── Fresh pair ───────────────────────────────────
-        self.state = self.PAIR
-        self.message = "Pairing with %s..." % name
+        self._set_ui(state=self.PAIR, message="Pairing with %s..." % name)
 
         # Try pairing up to 3 times
         paired = False
@@ -399,14 +475,14 @@ class BluetoothScreen:
             self._log("pair attempt %d failed" % (pair_attempt + 1))
             # Remove and re-discover before retry
             self._remove_device(mac)
-            self._run("timeout 5 bluetoothctl scan on >/dev/null 2>&1",
-                       timeout=8)
+            self._run("timeout 5 bluetoothctl scan %s >/dev/null 2>&1"
+                      % self._get_scan_mode(), timeout=8)
             time.sleep(1)
 
         if not paired:
-            self.state = self.ERROR
-            self.error_msg = ("Pairing failed.\nPut device in pairing\n"
-                              "mode and try again.")
+            self._set_ui(state=self.ERROR,
+                         error_msg=("Pairing failed.\nPut device in pairing\n"
+                                    "mode and try again."))
             self._log("PAIR FAILED after retries")
             return
 
@@ -415,8 +491,7 @@ class BluetoothScreen:
         time.sleep(0.5)
 
         # ── Connect after fresh pair ──────────────────────
-        self.state = self.CONNECT
-        self.message = "Connecting to %s..." % name
+        self._set_ui(state=self.CONNECT, message="Connecting to %s..." % name)
 
         for attempt in range(3):
             self._log("post-pair connect attempt %d" % (attempt + 1))
@@ -438,97 +513,122 @@ class BluetoothScreen:
                 # Non-auth failure — just wait and retry
                 time.sleep(2)
 
-        self.state = self.ERROR
-        self.error_msg = ("Connection failed.\nPut device in pairing\n"
-                          "mode and try again.")
+        self._set_ui(state=self.ERROR,
+                     error_msg=("Connection failed.\nPut device in pairing\n"
+                                "mode and try again."))
         self._log("FINAL: connection failed after all attempts")
 
     def _finish_connect(self, mac, name):
-        """Finalize a successful connection."""
-        self.state = self.DONE
-        self.message = "Connected to %s!" % name
-        self.settings["bt_device_mac"] = mac
-        self.settings["bt_device_name"] = name
+        """Finalize a successful connection.
+
+        The device is staged with the DONE state so that
+        _apply_pending_ui() saves it on the UI thread in the same step
+        that shows DONE, before [A]/[B] can leave the screen.
+        """
+        self._set_ui(state=self.DONE, message="Connected to %s!" % name,
+                     _pair_result=(mac, name))
         self._log("SUCCESS: connected to %s (%s)" % (name, mac))
 
     def handle_input(self, button, event_type, pager):
-        BTN_A = 0x10
-        BTN_B = 0x20
-        BTN_UP = 0x01
-        BTN_DOWN = 0x02
-
         if event_type != 1:
             return None
+        handler = self._handlers.get(self.state, {}).get(button)
+        if handler:
+            return handler()
+        return None
 
-        if self.state == self.SELECT_DEVICE:
-            if button == BTN_UP:
-                self.selected = max(0, self.selected - 1)
-                if self.selected < self.scroll_offset:
-                    self.scroll_offset = self.selected
-            elif button == BTN_DOWN:
-                self.selected = min(len(self.devices) - 1, self.selected + 1)
-                if self.selected >= self.scroll_offset + self.visible_count:
-                    self.scroll_offset = (self.selected -
-                                          self.visible_count + 1)
-            elif button == BTN_A:
-                if self.devices:
-                    mac, name = self.devices[self.selected]
-                    # Strip tags
-                    name = name.replace(" [paired]", "").replace(" [saved]", "")
-                    # Defer to update() so "Pairing..." draws first
-                    self.state = self.PAIR
-                    self.message = "Pairing with %s..." % name
-                    self._pair_pending = (mac, name)
-            elif button == BTN_B:
-                return self.return_screen
-
-        elif self.state == self.SCAN:
-            if button == BTN_B:
-                return self.return_screen
-            elif button == BTN_A:
-                self._start_scan()
-
-        elif self.state == self.ERROR:
-            if button == BTN_A:
-                # Retry
-                self.state = self.CHECK_ADAPTER
-                self._check_adapter()
-            elif button == BTN_B:
-                return self.return_screen
-
-        elif self.state == self.DONE:
-            if button == BTN_A or button == BTN_B:
-                return self.return_screen
-
-        elif self.state == self.CHECK_ADAPTER:
-            if button == BTN_B:
-                return self.return_screen
+    def _build_handlers(self):
+        """Per-state button tables used by handle_input()."""
+        back = lambda: self.return_screen
+        return {
+            self.SELECT_DEVICE: {
+                BTN_UP: self._select_prev,
+                BTN_DOWN: self._select_next,
+                BTN_A: self._pair_selected,
+                BTN_B: back,
+            },
+            self.SCAN: {BTN_A: self._start_scan, BTN_B: back},
+            self.ERROR: {BTN_A: self._retry, BTN_B: back},
+            self.DONE: {BTN_A: back, BTN_B: back},
+            self.CHECK_ADAPTER: {BTN_B: back},
+        }
+
+    def _select_prev(self):
+        self.selected = max(0, self.selected - 1)
+        if self.selected < self.scroll_offset:
+            self.scroll_offset = self.selected
+
+    def _select_next(self):
+        self.selected = min(len(self.devices) - 1, self.selected + 1)
+        if self.selected >= self.scroll_offset + self.visible_count:
+            self.scroll_offset = self.selected - self.visible_count + 1
+
+    def _pair_selected(self):
+        if not self.devices:
+            return
+        mac, name = self.devices[self.selected]
+        # Strip tags
+        name = name.replace(" [paired]", "").replace(" [saved]", "")
+        # Pair on a worker thread so the screen keeps drawing. It is a
+        # daemon so quitting mid-pair does not wait on bluetoothctl.
+        self.state = self.PAIR
+        self.message = "Pairing with %s..." % name
+        self._pair_error = None
+        self._pair_thread = threading.Thread(
+            target=self._pair_worker, args=(mac, name), daemon=True)
+        self._pair_thread.start()
+
+    def _pair_worker(self, mac, name):
+        """Thread body: run _pair_device, keeping any exception for
+        _finish_pair()."""
+        try:
+            self._pair_device(mac, name)
+        except Exception as e:
+            self._pair_error = e
 
-        return None
+    def _retry(self):
+        self.state = self.CHECK_ADAPTER
+        self._check_adapter()
 
     def update(self, status):
         """Called each frame — advance async operations."""
-        if self._pair_pending:
-            # Wait one frame so "Pairing..." message draws before blocking
-            self._pair_draw_wait += 1
-            if self._pair_draw_wait < 2:
-                return
-            mac, name = self._pair_pending
-            self._pair_pending = None
-            self._pair_draw_wait = 0
-            self._pair_device(mac, name)
+        if self._pair_thread:
+            done = not self._pair_thread.is_alive()
+            self._apply_pending_ui()
+            if done:
+                self._finish_pair()
         elif self.state == self.SCAN:
             self._poll_scan()
 
+    def _finish_pair(self):
+        """Collect the pairing worker's result (UI thread)."""
+        self._pair_thread = None
+        if self._pair_error is not None:
+            self._log("pair_device crashed: %s" % self._pair_error)
+            self.state = self.ERROR
+            self.error_msg = "Pairing error.\nCheck pageramp_bt.log."
+
+    # Skin elements used by this screen's draw methods
+    _COLOR_ELEMENTS = ("bg", "title_bar_bg", "title_bar_text",
+                       "track_highlight", "progress_knob", "progress_bg",
+                       "progress_fill")
+
+    def _rebuild_colors(self, skin):
+        """Snapshot the colors this screen draws with from skin."""
+        self._colors = {name: skin.color(color_id(name))
+                        for name in self._COLOR_ELEMENTS}
+        self._colors_skin = skin
+
     def draw(self, pager, skin):
-        c = skin.color
-        pager.clear(c("bg"))
+        if skin is not self._colors_skin:
+            self._rebuild_colors(skin)
+        c = self._colors
+        pager.clear(c["bg"])
 
         # Header
-        pager.fill_rect(0, 0, SCREEN_W, 22, c("title_bar_bg"))
-        state_label = self.STATE_LABELS[self.state]
-        pager.draw_ttf(6, 2, "Bluetooth: " + state_label,
-                      c("title_bar_text"), FONT_PATH, skin.font("title"))
+        pager.fill_rect(0, 0, SCREEN_W, 22, c["title_bar_bg"])
+        pager.draw_ttf(6, 2, self.STATE_TITLES[self.state],
+                      c["title_bar_text"], FONT_PATH, skin.font("title"))
 
         if self.state == self.SELECT_DEVICE:
             self._draw_device_list(pager, skin)
@@ -543,7 +643,7 @@ class BluetoothScreen:
         self._draw_hints(pager, skin)
 
     def _draw_device_list(self, pager, skin):
-        c = skin.color
+        c = self._colors
         y = 26
         for i in range(self.visible_count):
             idx = self.scroll_offset + i
@@ -555,59 +655,42 @@ class BluetoothScreen:
 
             if is_sel:
                 pager.fill_rect(0, y, SCREEN_W, self.line_height - 1,
-                               c("track_highlight"))
-
-            tc = c("title_bar_text") if is_sel else c("progress_knob")
-            display = "%s  %s" % (name, mac)
-            # Truncate
-            max_w = SCREEN_W - 16
-            while (pager.ttf_width(display, FONT_PATH, self.font_size) >
-                   max_w and len(display) > 5):
-                display = display[:-1]
+                               c["track_highlight"])
+
+            tc = c["title_bar_text"] if is_sel else c["progress_knob"]
+            display = _fit_text(pager, "%s  %s" % (name, mac),
+                                SCREEN_W - 16, self.font_size, 5)
             pager.draw_ttf(4, y + 1, display, tc, FONT_PATH, self.font_size)
             y += self.line_height
 
     def _draw_error(self, pager, skin):
-        c = skin.color
+        c = self._colors
         y = 50
         for line in self.error_msg.split("\n"):
-            pager.draw_ttf(20, y, line, c("title_bar_text"), FONT_PATH, 14)
+            pager.draw_ttf(20, y, line, c["title_bar_text"], FONT_PATH, 14)
             y += 20
 
     def _draw_done(self, pager, skin):
-        c = skin.color
-        pager.draw_ttf(20, 60, self.message, c("title_bar_text"), FONT_PATH, 16)
+        c = self._colors
+        pager.draw_ttf(20, 60, self.message, c["title_bar_text"], FONT_PATH, 16)
 
         mac = self.settings.get("bt_device_mac", "")
         if mac:
-            pager.draw_ttf(20, 90, mac, c("title_bar_text"), FONT_PATH, 12)
+            pager.draw_ttf(20, 90, mac, c["title_bar_text"], FONT_PATH, 12)
 
     def _draw_status(self, pager, skin):
-        c = skin.color
-        pager.draw_ttf(20, 60, self.message, c("title_bar_text"), FONT_PATH, 14)
+        c = self._colors
+        pager.draw_ttf(20, 60, self.message, c["title_bar_text"], FONT_PATH, 14)
 
         # Scanning animation
         if self.state == self.SCAN:
-            elapsed = time.time() - self._scan_start
-            bar_w = int((SCREEN_W - 40) * min(1.0,
-                        elapsed / self._scan_duration))
-            pager.fill_rect(20, 100, SCREEN_W - 40, 6, c("progress_bg"))
+            bar_w = int((SCREEN_W - 40) * self._scan_progress)
+            pager.fill_rect(20, 100, SCREEN_W - 40, 6, c["progress_bg"])
             if bar_w > 0:
-                pager.fill_rect(20, 100, bar_w, 6, c("progress_fill"))
+                pager.fill_rect(20, 100, bar_w, 6, c["progress_fill"])
 
     def _draw_hints(self, pager, skin):
-        c = skin.color
+        c = self._colors
         y = SCREEN_H - 16
-
-        if self.state == self.SELECT_DEVICE:
-            hints = "[A] Select  [B] Back  [UP/DN] Navigate"
-        elif self.state == self.SCAN:
-            hints = "[A] Rescan  [B] Back"
-        elif self.state == self.ERROR:
-            hints = "[A] Retry  [B] Back"
-        elif self.state == self.DONE:
-            hints = "[A/B] Done"
-        else:
-            hints = "[B] Back"
-
-        pager.draw_ttf(8, y, hints, c("progress_knob"), FONT_PATH, 10)
+        hints = self.STATE_HINTS.get(self.state, "[B] Back")
+        pager.draw_ttf(8, y, hints, c["progress_knob"], FONT_PATH, 10)
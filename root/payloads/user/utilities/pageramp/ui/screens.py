@@ -9,15 +9,44 @@ Each screen has:
 
 import os
 import time
+from array import array
+from types import SimpleNamespace
 
+from ui.skin import C, color_id
 from ui.widgets import (ScrollText, ProgressBar, VolumeBar, TrackList,
                         TransportIcons, TimeDisplay, FONT_PATH,
-                        _format_time)
+                        _fit_text, _format_time, _measure)
 
 # Screen dimensions (landscape 270)
 SCREEN_W = 480
 SCREEN_H = 222
 
+# Button bitmasks as reported by the pager input events
+BTN_UP = 0x01
+BTN_DOWN = 0x02
+BTN_LEFT = 0x04
+BTN_RIGHT = 0x08
+BTN_A = 0x10
+BTN_B = 0x20
+
+
+def _title_spans(pager, skin, title, right=None):
+    """Title-bar text spans: title on the left, optional text right.
+    Screens cache the result until the skin or the text changes."""
+    color = skin.color(C.TITLE_BAR_TEXT)
+    fs = skin.font("title")
+    spans = [(6, 2, title, color, fs)]
+    if right:
+        rw = _measure(pager, right, fs)
+        spans.append((SCREEN_W - rw - 6, 2, right, color, fs))
+    return tuple(spans)
+
+
+def _draw_spans(pager, spans):
+    """Draw cached (x, y, text, color, size) spans in FONT_PATH."""
+    for x, y, text, color, fs in spans:
+        pager.draw_ttf(x, y, text, color, FONT_PATH, fs)
+
 
 class StartScreen:
     """Start menu screen — shown on app launch."""
@@ -36,101 +65,120 @@ class StartScreen:
         self.selected = 1  # default to "Start Player"
         self.font_size = 14
         self.line_height = 24
+        # Per-item (label, selected label, selected width), rebuilt only
+        # when the theme name shown in the "Theme" row changes
+        self._menu_cache = None
+        self._menu_theme = None
+        self._handlers = {
+            BTN_UP: self._select_prev,
+            BTN_DOWN: self._select_next,
+            BTN_A: self._activate,
+            BTN_LEFT: self._theme_prev,
+            BTN_RIGHT: self._theme_next,
+        }
 
     def handle_input(self, button, event_type, pager):
-        BTN_A = 0x10
-        BTN_B = 0x20
-        BTN_UP = 0x01
-        BTN_DOWN = 0x02
-        BTN_LEFT = 0x04
-        BTN_RIGHT = 0x08
-
         if event_type != 1:
             return None
+        handler = self._handlers.get(button)
+        if handler:
+            return handler()
+        return None
 
-        if button == BTN_UP:
-            self.selected = (self.selected - 1) % len(self.MENU_ITEMS)
-        elif button == BTN_DOWN:
-            self.selected = (self.selected + 1) % len(self.MENU_ITEMS)
-        elif button == BTN_A:
-            _, action = self.MENU_ITEMS[self.selected]
-            if action == "cycle_theme":
-                self.skin_manager.next_skin()
-                self.settings["theme"] = self.skin_manager.current_name
-            else:
-                return action
-        elif button == BTN_LEFT:
-            if self.MENU_ITEMS[self.selected][1] == "cycle_theme":
-                self.skin_manager.prev_skin()
-                self.settings["theme"] = self.skin_manager.current_name
-        elif button == BTN_RIGHT:
-            if self.MENU_ITEMS[self.selected][1] == "cycle_theme":
-                self.skin_manager.next_skin()
-                self.settings["theme"] = self.skin_manager.current_name
+    def _select_prev(self):
+        self.selected = (self.selected - 1) % len(self.MENU_ITEMS)
+
+    def _select_next(self):
+        self.selected = (self.selected + 1) % len(self.MENU_ITEMS)
+
+    def _activate(self):
+        _, action = self.MENU_ITEMS[self.selected]
+        if action != "cycle_theme":
+            return action
+        self._theme_next()
         return None
 
+    def _theme_prev(self):
+        if self.MENU_ITEMS[self.selected][1] == "cycle_theme":
+            self.skin_manager.prev_skin()
+            self.settings["theme"] = self.skin_manager.current_name
+
+    def _theme_next(self):
+        if self.MENU_ITEMS[self.selected][1] == "cycle_theme":
+            self.skin_manager.next_skin()
+            self.settings["theme"] = self.skin_manager.current_name
+
     def update(self, status):
         pass
 
+    def _build_menu_cache(self, pager):
+        """Precompute menu labels and highlight widths for the theme."""
+        name = self.skin_manager.current_name
+        cache = []
+        for label, action in self.MENU_ITEMS:
+            if action == "cycle_theme":
+                display = "Theme: " + name
+                sel_display = "Theme: < " + name + " >"
+            else:
+                display = sel_display = label
+            cache.append((display, sel_display,
+                          _measure(pager, sel_display, self.font_size)))
+        self._menu_cache = cache
+        self._menu_theme = name
+
     def draw(self, pager, skin):
         c = skin.color
-        pager.clear(c("bg"))
+        pager.clear(c(C.BG))
 
         if skin.style == "classic":
             # Winamp-style metallic title bar
-            pager.fill_rect(0, 0, SCREEN_W, 22, c("title_bar_bg"))
-            pager.draw_ttf(6, 2, "PagerAmp v1.0", c("title_bar_text"),
+            pager.fill_rect(0, 0, SCREEN_W, 22, c(C.TITLE_BAR_BG))
+            pager.draw_ttf(6, 2, "PagerAmp v1.0", c(C.TITLE_BAR_TEXT),
                           FONT_PATH, skin.font("title"))
-            pager.hline(0, 22, SCREEN_W, c("separator"))
+            pager.hline(0, 22, SCREEN_W, c(C.SEPARATOR))
             # Beveled edges
-            pager.hline(0, 0, SCREEN_W, c("separator"))
-            pager.draw_ttf_centered(32, "PagerAmp", c("title_bar_text"),
+            pager.hline(0, 0, SCREEN_W, c(C.SEPARATOR))
+            pager.draw_ttf_centered(32, "PagerAmp", c(C.TITLE_BAR_TEXT),
                                     FONT_PATH, 24)
             sub_y = 60
 
         elif skin.style == "retro":
             # Retro double-line border frame
-            pager.rect(2, 2, SCREEN_W - 4, SCREEN_H - 4, c("accent"))
-            pager.rect(5, 5, SCREEN_W - 10, SCREEN_H - 10, c("text_dim"))
-            pager.draw_ttf_centered(16, "PAGERAMP", c("accent"),
+            pager.rect(2, 2, SCREEN_W - 4, SCREEN_H - 4, c(C.ACCENT))
+            pager.rect(5, 5, SCREEN_W - 10, SCREEN_H - 10, c(C.TEXT_DIM))
+            pager.draw_ttf_centered(16, "PAGERAMP", c(C.ACCENT),
                                     FONT_PATH, 26)
             sub_y = 46
 
         else:
             # Modern — clean with accent line
-            pager.draw_ttf_centered(16, "PagerAmp", c("accent"),
+            pager.draw_ttf_centered(16, "PagerAmp", c(C.ACCENT),
                                     FONT_PATH, 28)
             line_w = 120
-            pager.hline((SCREEN_W - line_w) // 2, 48, line_w, c("accent"))
+            pager.hline((SCREEN_W - line_w) // 2, 48, line_w, c(C.ACCENT))
             sub_y = 54
 
         # BT status
         bt_name = self.settings.get("bt_device_name", "")
         if bt_name:
             pager.draw_ttf_centered(sub_y + 4, "BT: " + bt_name,
-                                    c("info"), FONT_PATH, 11)
+                                    c(C.INFO), FONT_PATH, 11)
 
-        # Menu items
+        # Menu items (theme may also change from the settings screen)
+        if (self._menu_cache is None
+                or self._menu_theme != self.skin_manager.current_name):
+            self._build_menu_cache(pager)
         y = 88
-        for i, (label, action) in enumerate(self.MENU_ITEMS):
+        for i, (display, sel_display, tw) in enumerate(self._menu_cache):
             is_sel = (i == self.selected)
 
-            if action == "cycle_theme":
-                name = self.skin_manager.current_name
-                if is_sel:
-                    display = "Theme: < " + name + " >"
-                else:
-                    display = "Theme: " + name
-            else:
-                display = label
-
             if is_sel:
-                tw = pager.ttf_width(display, FONT_PATH, self.font_size)
+                display = sel_display
                 hx = (SCREEN_W - tw) // 2 - 8
                 pager.fill_rect(hx, y, tw + 16, self.line_height - 2,
-                               c("track_highlight"))
+                               c(C.TRACK_HIGHLIGHT))
 
-            tc = c("title_bar_text") if is_sel else c("progress_knob")
+            tc = c(C.TITLE_BAR_TEXT) if is_sel else c(C.PROGRESS_KNOB)
             pager.draw_ttf_centered(y + 4, display, tc,
                                     FONT_PATH, self.font_size)
 
@@ -138,7 +186,7 @@ class StartScreen:
 
         # Bottom hints
         pager.draw_ttf(8, SCREEN_H - 14, "[A] Select  [B] Exit",
-                      c("title_bar_text"), FONT_PATH, 10)
+                      c(C.TITLE_BAR_TEXT), FONT_PATH, 10)
 
 
 class NowPlayingScreen:
@@ -152,6 +200,25 @@ class NowPlayingScreen:
 
     # Extended: 0-4 TransportIcons, 5=eject, 6=shuffle, 7=repeat
     _BTN_COUNT = 8
+    # Button index after LEFT / RIGHT, clamped at the ends
+    _BTN_PREV = (0,) + tuple(range(_BTN_COUNT - 1))
+    _BTN_NEXT = tuple(range(1, _BTN_COUNT)) + (_BTN_COUNT - 1,)
+
+    # (handle attribute, skin "knobs" key, default file name)
+    _KNOB_SPRITES = (
+        ("_slider_handle", "seek", "slider-knob.png"),
+        ("_vol_knob_handle", "vol", "vol-knob.png"),
+        ("_slider_active_handle", "seek_active", "slider-knob-active.png"),
+        ("_vol_knob_active_handle", "vol_active", "vol-knob-active.png"),
+    )
+    _KNOB_ATTRS = tuple(attr for attr, _, _ in _KNOB_SPRITES)
+    _NO_OVERLAYS = (None, None)
+
+    # Button index -> (toggle slot: 1=shuffle 2=repeat, lit active sprite)
+    _ACTIVE_TOGGLED = {
+        6: (1, "shuffle-active-toggled.png"),
+        7: (2, "repeat-active-toggled.png"),
+    }
 
     def __init__(self, client, playlist):
         self.client = client
@@ -170,28 +237,40 @@ class NowPlayingScreen:
         # Navigation state
         self._focus = self.FOCUS_TRANSPORT
         self._btn_index = 1  # default to play
+        self._handlers = self._build_handlers()
 
         # Shuffle/repeat sprite hit-boxes (x, y, w, h)
         self._shuffle_box = (0, 0, 0, 0)
         self._repeat_box = (0, 0, 0, 0)
 
         # Classic groove positions for dynamic knobs
-        # (x_start, x_end, y) — knob drawn within this range
-        self._vol_groove = (190, 294, 112)   # orange groove (up 5)
-        self._bal_groove = (311, 370, 112)   # green groove (up 5)
+        # (x_start, x_end, y, knob_w) — knob drawn within this range
+        self._seek_groove = (26, 430, 139, 29)
+        self._vol_groove = (190, 294, 112, 28)   # orange groove (up 5)
+        self._bal_groove = (311, 370, 112, 28)   # green groove (up 5)
 
         # Active button sprite handles (indexed by _btn_index 0-7)
-        self._active_handles = [None] * self._BTN_COUNT
-        self._active_loaded = False
+        # Frozen into tuples once loaded; () until then
+        self._active_handles = ()
+        self._sprites_loaded = False
 
         # Sprite info loaded from skin JSON (populated in layout())
-        self._active_sprite_info = []
-        self._toggle_handles = {}
-        self._toggle_loaded = False
-        self._toggle_sprite_info = []
+        self._active_filenames = ()
+        self._active_x = array("h")
+        self._active_y = array("h")
+        self._toggle_handles = ()
+        self._overlay_handles = self._NO_OVERLAYS  # shuffle, repeat "toggled"
+        self._toggle_filenames = ()
+        self._sprite_lut = ()
+
+        # File names present in the current skin directory
+        self._skin_files = set()
+        self._skin_files_dir = None
 
         self._layout_done = False
         self._layout_style = None
+        self._colors = None
+        self._draw_style = None
         self._last_state = "stopped"
         self._bg_handle = None
         self._bg_loaded_path = None
@@ -201,13 +280,25 @@ class NowPlayingScreen:
         self._vol_knob_handle = None  # vol/bal knob (slider2.png)
         self._slider_active_handle = None   # dark-tint seek knob
         self._vol_knob_active_handle = None  # dark-tint vol/bal knob
-        self._knobs_loaded = False
 
         # Temporary value overlay timers
         self._vol_show_until = 0
         self._bal_show_until = 0
         self._VALUE_DISPLAY_SECS = 2
 
+        # Fingerprint of the values the last frame was drawn from; draw()
+        # skips unchanged frames once both display buffers hold them.
+        self._last_fp = None
+        self._redraws_left = 0
+
+        # Track title, recomputed by update() when the track changes
+        self._track_key = None
+        self._track_name = ""
+
+        # Classic LCD info line, rebuilt by update() when its inputs change
+        self._lcd_key = None
+        self._lcd_info = ""
+
     def layout(self, skin):
         """Calculate widget positions from skin layout JSON."""
         L = skin.layout  # shorthand for layout lookup
@@ -224,6 +315,7 @@ class NowPlayingScreen:
             ts.get("x", 195), ts.get("y", 50),
             ts.get("w", 265), title_fs,
             speed=ts.get("speed", 2))
+        self.title_scroll.set_text(self._track_name)
 
         pb = L("progress_bar") or {}
         self.progress = ProgressBar(
@@ -255,105 +347,113 @@ class NowPlayingScreen:
         buttons = sprites.get("buttons", [])
         toggles = sprites.get("toggles", {})
 
-        # Button sprites (transport + eject)
-        self._active_sprite_info = [
-            (b["file"], b["x"], b["y"]) for b in buttons
-        ]
-        # Add shuffle and repeat active sprites to button list
-        if "shuffle" in toggles:
-            s = toggles["shuffle"]
-            self._active_sprite_info.append((s["file"], s["x"], s["y"]))
-        if "repeat" in toggles:
-            r = toggles["repeat"]
-            self._active_sprite_info.append((r["file"], r["x"], r["y"]))
-
-        # Toggle sprites (on/active states for shuffle/repeat)
-        self._toggle_sprite_info = []
-        for key in ("shuffle_on", "shuffle_active", "repeat_on",
-                     "repeat_active"):
+        # Button sprites (transport + eject), plus the shuffle and
+        # repeat active sprites, as parallel file name / x / y arrays
+        active = list(buttons)
+        for key in ("shuffle", "repeat"):
             if key in toggles:
-                t = toggles[key]
-                self._toggle_sprite_info.append(
-                    (t["file"], t["x"], t["y"]))
-
-        # Reset loaded state so sprites reload with new skin
-        self._active_loaded = False
-        self._toggle_loaded = False
-        self._knobs_loaded = False
-        self._active_handles = [None] * len(self._active_sprite_info)
-        self._toggle_handles = {}
-
+                active.append(toggles[key])
+        self._active_filenames = tuple(b["file"] for b in active)
+        self._active_x = array("h", [b["x"] for b in active])
+        self._active_y = array("h", [b["y"] for b in active])
+
+        # Toggle sprites (on/active states for shuffle/repeat); their
+        # positions are fixed in draw(), so only the names are kept
+        self._toggle_filenames = tuple(
+            toggles[key]["file"]
+            for key in ("shuffle_on", "shuffle_active", "repeat_on",
+                        "repeat_active")
+            if key in toggles)
+
+        # Reload sprites with the new skin (the loader frees the old ones)
+        self._sprites_loaded = False
+
+        self._bind_skin(skin)
+        self._draw_style = {
+            "classic": self._draw_classic,
+            "modern": self._draw_modern,
+        }.get(skin.style, self._draw_retro)
         self._layout_done = True
         self._layout_style = skin.name
+        self.invalidate()
+
+    # Skin colors used by draw(), snapshotted by _bind_skin()
+    _COLOR_NAMES = (
+        "accent", "bg", "progress_bg", "progress_fill",
+        "progress_knob", "repeat_off", "repeat_on", "separator",
+        "shuffle_off", "shuffle_on", "text_dim", "time",
+        "title_bar_bg", "title_bar_text", "transport",
+        "transport_active", "volume_bg", "volume_fill",
+    )
+
+    def _bind_skin(self, skin):
+        """Snapshot this skin's colors as attributes of self._colors."""
+        self._colors = SimpleNamespace(
+            **{name: skin.color(color_id(name))
+               for name in self._COLOR_NAMES})
+
+    def invalidate(self):
+        """Force a full redraw on the next frame."""
+        self._last_fp = None
 
     def handle_input(self, button, event_type, pager):
         """Handle d-pad navigation between focus rows."""
-        BTN_A = 0x10
-        BTN_B = 0x20
-        BTN_UP = 0x01
-        BTN_DOWN = 0x02
-        BTN_LEFT = 0x04
-        BTN_RIGHT = 0x08
-
         if event_type != 1:
             return None
+        handler = self._handlers[self._focus].get(button)
+        if handler:
+            return handler()
+        return None
+
+    def _build_handlers(self):
+        """Per-focus-row button tables used by handle_input()."""
+        focus = self._set_focus
+        to_transport = lambda: focus(self.FOCUS_TRANSPORT)
+        return {
+            self.FOCUS_TRANSPORT: {
+                BTN_LEFT: lambda: self._move_btn(self._BTN_PREV),
+                BTN_RIGHT: lambda: self._move_btn(self._BTN_NEXT),
+                BTN_UP: lambda: focus(self.FOCUS_SEEK),
+                BTN_A: self._execute_action,
+                BTN_B: lambda: "menu",
+            },
+            self.FOCUS_SEEK: {
+                BTN_LEFT: lambda: self.client.seek_relative(-10),
+                BTN_RIGHT: lambda: self.client.seek_relative(10),
+                BTN_UP: lambda: focus(self.FOCUS_VOLUME),
+                BTN_DOWN: to_transport,
+                BTN_B: to_transport,
+            },
+            self.FOCUS_VOLUME: {
+                BTN_LEFT: lambda: self._nudge_volume(-5),
+                BTN_RIGHT: lambda: self._nudge_volume(5),
+                BTN_UP: lambda: focus(self.FOCUS_BALANCE),
+                BTN_DOWN: lambda: focus(self.FOCUS_SEEK),
+                BTN_B: to_transport,
+            },
+            self.FOCUS_BALANCE: {
+                BTN_LEFT: lambda: self._nudge_balance(-5),
+                BTN_RIGHT: lambda: self._nudge_balance(5),
+                BTN_DOWN: lambda: focus(self.FOCUS_VOLUME),
+                BTN_B: to_transport,
+            },
+        }
 
-        if self._focus == self.FOCUS_TRANSPORT:
-            if button == BTN_LEFT:
-                self._btn_index = max(0, self._btn_index - 1)
-                self._sync_transport_sel()
-            elif button == BTN_RIGHT:
-                self._btn_index = min(self._BTN_COUNT - 1,
-                                      self._btn_index + 1)
-                self._sync_transport_sel()
-            elif button == BTN_UP:
-                self._focus = self.FOCUS_SEEK
-            elif button == BTN_A:
-                result = self._execute_action()
-                if result:
-                    return result
-            elif button == BTN_B:
-                return "menu"
-
-        elif self._focus == self.FOCUS_SEEK:
-            if button == BTN_LEFT:
-                self.client.seek_relative(-10)
-            elif button == BTN_RIGHT:
-                self.client.seek_relative(10)
-            elif button == BTN_UP:
-                self._focus = self.FOCUS_VOLUME
-            elif button == BTN_DOWN:
-                self._focus = self.FOCUS_TRANSPORT
-            elif button == BTN_B:
-                self._focus = self.FOCUS_TRANSPORT
-
-        elif self._focus == self.FOCUS_VOLUME:
-            if button == BTN_LEFT:
-                self.client.adjust_volume(-5)
-                self._vol_show_until = time.time() + self._VALUE_DISPLAY_SECS
-            elif button == BTN_RIGHT:
-                self.client.adjust_volume(5)
-                self._vol_show_until = time.time() + self._VALUE_DISPLAY_SECS
-            elif button == BTN_UP:
-                self._focus = self.FOCUS_BALANCE
-            elif button == BTN_DOWN:
-                self._focus = self.FOCUS_SEEK
-            elif button == BTN_B:
-                self._focus = self.FOCUS_TRANSPORT
-
-        elif self._focus == self.FOCUS_BALANCE:
-            if button == BTN_LEFT:
-                self._balance = max(0, self._balance - 5)
-                self._bal_show_until = time.time() + self._VALUE_DISPLAY_SECS
-            elif button == BTN_RIGHT:
-                self._balance = min(100, self._balance + 5)
-                self._bal_show_until = time.time() + self._VALUE_DISPLAY_SECS
-            elif button == BTN_DOWN:
-                self._focus = self.FOCUS_VOLUME
-            elif button == BTN_B:
-                self._focus = self.FOCUS_TRANSPORT
+    def _set_focus(self, focus):
+        self._focus = focus
 
-        return None
+    def _move_btn(self, table):
+        self._btn_index = table[self._btn_index]
+        self._sync_transport_sel()
+
+    def _nudge_volume(self, delta):
+        self.client.adjust_volume(delta)
+        self._vol_show_until = time.time() + self._VALUE_DISPLAY_SECS
+
+    def _nudge_balance(self, delta):
+        bal = self._balance + delta
+        self._balance = 0 if bal < 0 else 100 if bal > 100 else bal
+        self._bal_show_until = time.time() + self._VALUE_DISPLAY_SECS
 
     def _sync_transport_sel(self):
         """Keep TransportIcons.selected in sync with _btn_index."""
@@ -397,6 +497,116 @@ class NowPlayingScreen:
             if track:
                 self.client.play(track)
 
+    @staticmethod
+    def _format_lcd_info(rate, track_num, track_total, dur,
+                         pl_pos, pl_len):
+        """Bitrate | track/total | duration line for the classic LCD."""
+        if track_total <= 0:
+            track_num = pl_pos + 1 if pl_len else 0
+            track_total = pl_len
+        if rate and dur > 0:
+            return "%dk  %d/%d  %s" % (rate // 1000, track_num, track_total,
+                                       _format_time(dur))
+        if rate:
+            return "%dk  %d/%d" % (rate // 1000, track_num, track_total)
+        if dur > 0:
+            return "%d/%d  %s" % (track_num, track_total, _format_time(dur))
+        return "%d/%d" % (track_num, track_total)
+
+    def _draw_knob(self, pager, groove, frac, handle, active_handle,
+                   focused):
+        """Draw a knob sprite at frac (0.0-1.0) along groove."""
+        x0, x1, y, knob_w = groove
+        # even x keeps the blit on the aligned copy path
+        x = (x0 + int((x1 - x0 - knob_w) * frac)) & ~1
+        if focused and active_handle:
+            handle = active_handle
+        pager.draw_image(x, y, handle)
+
+    def _free_and_none(self, pager, attrs):
+        """Free the image handle held in each named attribute."""
+        for attr in attrs:
+            handle = getattr(self, attr)
+            if handle:
+                pager.free_image(handle)
+            setattr(self, attr, None)
+
+    def _free_sprites(self, pager):
+        """Free all button, toggle and knob sprites (not the bg)."""
+        for h in self._active_handles + self._toggle_handles:
+            if h:
+                pager.free_image(h)
+        # Empty tuples are shared, so resetting allocates nothing
+        self._active_handles = ()
+        self._toggle_handles = ()
+        self._overlay_handles = self._NO_OVERLAYS
+        self._sprite_lut = ()
+        self._free_and_none(pager, self._KNOB_ATTRS)
+
+    def _build_sprite_lut(self, toggles):
+        """Per-button (plain, toggled, toggle slot) handles for draw().
+        toggles maps toggle sprite file names to loaded handles."""
+        lut = []
+        for idx, handle in enumerate(self._active_handles):
+            slot, fname = self._ACTIVE_TOGGLED.get(idx, (0, None))
+            toggled = toggles.get(fname) if fname else None
+            lut.append((handle, toggled or handle, slot))
+        self._sprite_lut = tuple(lut)
+
+    def _resolve_sprite(self, idx, shuffle, repeat):
+        """Active sprite for button idx, lit if its toggle is on."""
+        plain, toggled, slot = self._sprite_lut[idx]
+        return toggled if (False, shuffle, repeat != 0)[slot] else plain
+
+    def _draw_classic(self, pager, skin, has_bg):
+        """Classic style: Winamp-like LCD readouts."""
+        c = self._colors
+        if not has_bg:
+            pager.fill_rect(0, 0, SCREEN_W, 22, c.title_bar_bg)
+            pager.draw_ttf(6, 2, "PagerAmp", c.title_bar_text,
+                          FONT_PATH, skin.font("title"))
+            pager.hline(0, 23, SCREEN_W, c.separator)
+
+        # Left LCD area (x=20-178, y=45-109)
+        # Large time display (top-left)
+        time_text = _format_time(self.time_display.seconds)
+        pager.draw_ttf(22, 46, time_text, c.text_dim, FONT_PATH, 40)
+
+        # State indicator (PLAY/STOP/PAUS) — top-right of LCD box
+        state_str = self._last_state[:4].upper()
+        sw = _measure(pager, state_str, 14)
+        pager.draw_ttf(172 - sw, 48, state_str, c.text_dim, FONT_PATH, 14)
+
+        # Bottom of LCD: bitrate | track/total | duration (doubled size)
+        # (built in update())
+        pager.draw_ttf(22, 98, self._lcd_info, c.text_dim, FONT_PATH, 18)
+
+    def _draw_modern(self, pager, skin, has_bg):
+        """Modern style: state and track counter header, centered time."""
+        c = self._colors
+        state_text = self._last_state.upper()
+        pager.draw_ttf(8, 4, state_text, c.text_dim,
+                      FONT_PATH, skin.font("label"))
+        track_info = "%d / %d" % (
+            self.client.status.get("track", 0),
+            self.client.status.get("total", 0))
+        tiw = _measure(pager, track_info, skin.font("label"))
+        pager.draw_ttf(SCREEN_W - tiw - 8, 4, track_info,
+                      c.text_dim, FONT_PATH, skin.font("label"))
+        time_str = _format_time(self.time_display.seconds)
+        tiw = _measure(pager, time_str, skin.font("time"))
+        self.time_display.x = ((SCREEN_W - tiw) // 2) & ~1
+        self.time_display.draw(pager, c.time)
+
+    def _draw_retro(self, pager, skin, has_bg):
+        """Retro style (and fallback): elapsed left, duration right."""
+        c = self._colors
+        self.time_display.draw(pager, c.time)
+        dur_str = _format_time(self.client.status.get("dur", 0))
+        dur_w = _measure(pager, dur_str, skin.font("time"))
+        pager.draw_ttf(SCREEN_W - dur_w - 8, self.time_display.y,
+                      dur_str, c.text_dim, FONT_PATH, skin.font("time"))
+
     def update(self, status):
         """Update widgets from daemon status."""
         self._last_state = status.get("state", "stopped")
@@ -411,12 +621,64 @@ class NowPlayingScreen:
         self.time_display.seconds = status.get("pos", 0)
         self.volume.level = status.get("vol", 80)
 
+        track_key = (self.playlist.current_track(), status.get("file", ""))
+        if track_key != self._track_key:
+            self._track_key = track_key
+            track_name = self.playlist.current_name()
+            if not track_name:
+                fname = track_key[1]
+                if fname:
+                    track_name = os.path.splitext(
+                        os.path.basename(fname))[0]
+                else:
+                    track_name = "No track loaded"
+            self._track_name = track_name
+            self.title_scroll.set_text(track_name)
+
+        # Whole seconds: dur is a float re-estimated on every status line
+        key = (status.get("rate", 44100), status.get("track", 0),
+               status.get("total", 0), int(status.get("dur", 0)),
+               self.playlist.position, self.playlist.length)
+        if key != self._lcd_key:
+            self._lcd_key = key
+            self._lcd_info = self._format_lcd_info(*key)
+
     def draw(self, pager, skin):
         """Render the now playing screen."""
         if not self._layout_done or skin.name != self._layout_style:
             self.layout(skin)
 
-        c = skin.color
+        # --- Scrolling track name (advance before the change check) ---
+        self.title_scroll.update()
+
+        # --- Skip the frame if nothing on screen would change ---
+        # There is no clip API, so any change repaints the whole screen.
+        status = self.client.status
+        now = time.time()
+        fp = (skin.name, self._last_state, self.transport.active,
+              int(self.time_display.seconds),
+              int(self.progress.position * 1000),
+              # Whole seconds, as drawn: dur is re-estimated on every
+              # status line and the "-remaining" label ticks on dur - pos
+              int(self.progress.duration),
+              int(self.progress.duration - self.progress.elapsed),
+              status.get("rate", 44100),
+              status.get("track", 0), status.get("total", 0),
+              self.playlist.position, self.playlist.length,
+              self._track_name, self.title_scroll.offset,
+              self.volume.level, self._balance,
+              self._focus, self._btn_index,
+              self.playlist.shuffle, self.playlist.repeat,
+              now < self._vol_show_until, now < self._bal_show_until)
+        if fp != self._last_fp:
+            self._last_fp = fp
+            # Draw twice so a double-buffered flip shows it on both pages
+            self._redraws_left = 2
+        elif self._redraws_left <= 0:
+            return
+        self._redraws_left -= 1
+
+        c = self._colors
         has_bg = False
 
         # Background image
@@ -424,40 +686,18 @@ class NowPlayingScreen:
         if bg:
             if bg != self._bg_loaded_path:
                 # Free all cached image handles
-                if self._bg_handle:
-                    pager.free_image(self._bg_handle)
-                for h in self._active_handles:
-                    if h is not None:
-                        pager.free_image(h)
-                self._active_handles = [None] * self._BTN_COUNT
-                self._active_loaded = False
-                if self._slider_handle:
-                    pager.free_image(self._slider_handle)
-                self._slider_handle = None
-                if self._vol_knob_handle:
-                    pager.free_image(self._vol_knob_handle)
-                self._vol_knob_handle = None
-                if self._slider_active_handle:
-                    pager.free_image(self._slider_active_handle)
-                self._slider_active_handle = None
-                if self._vol_knob_active_handle:
-                    pager.free_image(self._vol_knob_active_handle)
-                self._vol_knob_active_handle = None
-                self._knobs_loaded = False
-                for h in self._toggle_handles.values():
-                    if h is not None:
-                        pager.free_image(h)
-                self._toggle_handles = {}
-                self._toggle_loaded = False
+                self._free_and_none(pager, ("_bg_handle",))
+                self._free_sprites(pager)
+                self._sprites_loaded = False
                 self._bg_handle = pager.load_image(bg)
                 self._bg_loaded_path = bg
             if self._bg_handle:
                 pager.draw_image(0, 0, self._bg_handle)
                 has_bg = True
             else:
-                pager.clear(c("bg"))
+                pager.clear(c.bg)
         else:
-            pager.clear(c("bg"))
+            pager.clear(c.bg)
 
         bg_buttons = has_bg and skin.bg_has_buttons
 
@@ -465,251 +705,132 @@ class NowPlayingScreen:
         if bg_buttons:
             skin_dir = skin.skin_dir or (
                 os.path.dirname(skin.bg_path) if skin.bg_path else "")
-            if not self._active_loaded:
-                for i, (fname, _, _) in enumerate(
-                        self._active_sprite_info):
-                    apath = os.path.join(skin_dir, fname)
-                    if os.path.exists(apath):
-                        self._active_handles[i] = pager.load_image(
-                            apath)
-                self._active_loaded = True
-            if not self._knobs_loaded:
+            if not self._sprites_loaded:
+                self._free_sprites(pager)
+                # One readdir per skin instead of a stat() per sprite
+                if skin_dir != self._skin_files_dir:
+                    try:
+                        self._skin_files = set(os.listdir(skin_dir))
+                    except OSError:
+                        self._skin_files = set()
+                    self._skin_files_dir = skin_dir
+                files = self._skin_files
+                load = pager.load_image
+                join = os.path.join
+                # Handles stay fixed until the next skin, so freeze them
+                self._active_handles = tuple(
+                    load(join(skin_dir, fname)) if fname in files else None
+                    for fname in self._active_filenames)
                 knobs = skin.sprites().get("knobs", {})
-                for attr, key, fallback in [
-                    ("_slider_handle", "seek", "slider-knob.png"),
-                    ("_vol_knob_handle", "vol", "vol-knob.png"),
-                    ("_slider_active_handle", "seek_active",
-                     "slider-knob-active.png"),
-                    ("_vol_knob_active_handle", "vol_active",
-                     "vol-knob-active.png"),
-                ]:
+                for attr, key, fallback in self._KNOB_SPRITES:
                     fname = knobs.get(key, fallback)
-                    path = os.path.join(skin_dir, fname)
-                    if os.path.exists(path):
-                        setattr(self, attr, pager.load_image(path))
-                self._knobs_loaded = True
-            if not self._toggle_loaded:
-                for fname, _, _ in self._toggle_sprite_info:
-                    tpath = os.path.join(skin_dir, fname)
-                    if os.path.exists(tpath):
-                        self._toggle_handles[fname] = \
-                            pager.load_image(tpath)
-                self._toggle_loaded = True
-
-        # --- Classic skin: LCD info ---
-        if skin.style == "classic":
-            if not has_bg:
-                pager.fill_rect(0, 0, SCREEN_W, 22, c("title_bar_bg"))
-                pager.draw_ttf(6, 2, "PagerAmp", c("title_bar_text"),
-                              FONT_PATH, skin.font("title"))
-
-            # Left LCD area (x=20-178, y=45-109)
-            # Large time display (top-left)
-            time_text = _format_time(self.time_display.seconds)
-            pager.draw_ttf(22, 46, time_text, c("text_dim"),
-                          FONT_PATH, 40)
-
-            # State indicator (PLAY/STOP/PAUS) — top-right of LCD box
-            state_str = self._last_state[:4].upper()
-            sw = pager.ttf_width(state_str, FONT_PATH, 14)
-            pager.draw_ttf(172 - sw, 48, state_str, c("text_dim"),
-                          FONT_PATH, 14)
-
-            # Bottom of LCD: bitrate | track/total | duration (doubled size)
-            rate = self.client.status.get("rate", 44100)
-            rate_str = "%dk" % (rate // 1000) if rate else ""
-
-            track_num = self.client.status.get("track", 0)
-            track_total = self.client.status.get("total", 0)
-            if track_total > 0:
-                counter_str = "%d/%d" % (track_num, track_total)
-            else:
-                pos = (self.playlist.position + 1
-                       if self.playlist.length else 0)
-                counter_str = "%d/%d" % (pos, self.playlist.length)
-
-            dur = self.client.status.get("dur", 0)
-            dur_str = _format_time(dur) if dur > 0 else ""
-
-            info_parts = [s for s in [rate_str, counter_str, dur_str]
-                          if s]
-            info_line = "  ".join(info_parts)
-            pager.draw_ttf(22, 98, info_line, c("text_dim"),
-                          FONT_PATH, 18)
-
-        elif skin.style == "modern":
-            state_text = self._last_state.upper()
-            pager.draw_ttf(8, 4, state_text, c("text_dim"),
-                          FONT_PATH, skin.font("label"))
-            track_info = "%d / %d" % (
-                self.client.status.get("track", 0),
-                self.client.status.get("total", 0))
-            tiw = pager.ttf_width(track_info, FONT_PATH,
-                                  skin.font("label"))
-            pager.draw_ttf(SCREEN_W - tiw - 8, 4, track_info,
-                          c("text_dim"), FONT_PATH, skin.font("label"))
-            time_str = _format_time(self.time_display.seconds)
-            tiw = pager.ttf_width(time_str, FONT_PATH,
-                                  skin.font("time"))
-            self.time_display.x = (SCREEN_W - tiw) // 2
-            self.time_display.draw(pager, c("time"))
-
-        else:
-            # Retro
-            self.time_display.draw(pager, c("time"))
-            dur_str = _format_time(self.client.status.get("dur", 0))
-            dur_w = pager.ttf_width(dur_str, FONT_PATH,
-                                    skin.font("time"))
-            pager.draw_ttf(SCREEN_W - dur_w - 8, self.time_display.y,
-                          dur_str, c("text_dim"), FONT_PATH,
-                          skin.font("time"))
+                    if fname in files:
+                        setattr(self, attr, load(join(skin_dir, fname)))
+                toggles = {fname: load(join(skin_dir, fname))
+                           for fname in self._toggle_filenames
+                           if fname in files}
+                self._toggle_handles = tuple(toggles.values())
+                self._overlay_handles = (toggles.get("shuffle-toggled.png"),
+                                         toggles.get("repeat-toggled.png"))
+                self._build_sprite_lut(toggles)
+                self._sprites_loaded = True
+
+        # --- Style-specific time/state readouts ---
+        self._draw_style(pager, skin, has_bg)
 
         # --- Scrolling track name ---
-        track_name = self.playlist.current_name()
-        if not track_name:
-            fname = self.client.status.get("file", "")
-            if fname:
-                track_name = os.path.splitext(
-                    os.path.basename(fname))[0]
-            else:
-                track_name = "No track loaded"
-        self.title_scroll.set_text(track_name, pager)
-        self.title_scroll.update()
-        self.title_scroll.draw(pager, c("text_dim"))
+        self.title_scroll.draw(pager, c.text_dim)
 
-        # --- Seek knob (slider-knob.png on groove, no color fill) ---
+        # --- Seek / volume / balance knobs ---
         if bg_buttons:
+            focus = self._focus
             if self._slider_handle:
-                groove_x0 = 26   # left edge of seek groove
-                groove_x1 = 430  # right edge of seek groove
-                knob_w = 29
-                knob_range = groove_x1 - groove_x0 - knob_w
-                kx = groove_x0 + int(knob_range * self.progress.position)
-                if (self._focus == self.FOCUS_SEEK
-                        and self._slider_active_handle):
-                    pager.draw_image(kx, 139, self._slider_active_handle)
-                else:
-                    pager.draw_image(kx, 139, self._slider_handle)
-        else:
-            self.progress.draw(pager, c("progress_bg"),
-                              c("progress_fill"), c("progress_knob"),
-                              c("text_dim"), skin.font("label"))
-
-        # --- Volume knob (slider2.png on orange groove) ---
-        if bg_buttons and self._vol_knob_handle:
-            vx0, vx1, vy = self._vol_groove
-            knob_w = 28  # vol-knob.png width
-            vol_range = vx1 - vx0 - knob_w
-            vol_x = vx0 + int(vol_range * self.volume.level / 100)
-            if (self._focus == self.FOCUS_VOLUME
-                    and self._vol_knob_active_handle):
-                pager.draw_image(vol_x, vy, self._vol_knob_active_handle)
-            else:
-                pager.draw_image(vol_x, vy, self._vol_knob_handle)
-        elif not bg_buttons:
-            self.volume.draw(pager, c("volume_bg"), c("volume_fill"),
-                            c("text_dim"), skin.font("label"))
-
-        # --- Balance knob (slider2.png on green groove) ---
-        if bg_buttons and self._vol_knob_handle:
-            bx0, bx1, by = self._bal_groove
-            knob_w = 28
-            bal_range = bx1 - bx0 - knob_w
-            bal_x = bx0 + int(bal_range * self._balance / 100)
-            if (self._focus == self.FOCUS_BALANCE
-                    and self._vol_knob_active_handle):
-                pager.draw_image(bal_x, by, self._vol_knob_active_handle)
-            else:
-                pager.draw_image(bal_x, by, self._vol_knob_handle)
-
-        # --- Temporary value overlay (volume % / balance L-R) ---
-        now = time.time()
-        if now < self._vol_show_until:
-            vol_text = "VOL: %d%%" % self.volume.level
-            tw = pager.ttf_width(vol_text, FONT_PATH, 16)
-            ox = (SCREEN_W - tw) // 2
-            oy = 78
-            pager.fill_rect(ox - 6, oy - 4, tw + 12, 24, c("title_bar_bg"))
-            pager.draw_ttf(ox, oy, vol_text, c("title_bar_text"), FONT_PATH, 16)
-        if now < self._bal_show_until:
-            if self._balance == 50:
-                bal_text = "BAL: CENTER"
-            elif self._balance < 50:
-                bal_text = "BAL: %dL" % (50 - self._balance)
-            else:
-                bal_text = "BAL: %dR" % (self._balance - 50)
-            tw = pager.ttf_width(bal_text, FONT_PATH, 16)
-            ox = (SCREEN_W - tw) // 2
-            oy = 78
-            pager.fill_rect(ox - 6, oy - 4, tw + 12, 24, c("title_bar_bg"))
-            pager.draw_ttf(ox, oy, bal_text, c("title_bar_text"), FONT_PATH, 16)
-
-        # --- Transport icons ---
-        if bg_buttons:
-            self.transport.draw(pager, c("transport"),
-                               c("transport_active"), None,
-                               bg_has_buttons=True)
+                # slider-knob.png on the seek groove, no color fill
+                self._draw_knob(pager, self._seek_groove,
+                                self.progress.position,
+                                self._slider_handle,
+                                self._slider_active_handle,
+                                focus == self.FOCUS_SEEK)
+            if self._vol_knob_handle:
+                # vol-knob.png on the orange (volume) and green (balance)
+                # grooves
+                self._draw_knob(pager, self._vol_groove,
+                                self.volume.level / 100,
+                                self._vol_knob_handle,
+                                self._vol_knob_active_handle,
+                                focus == self.FOCUS_VOLUME)
+                self._draw_knob(pager, self._bal_groove,
+                                self._balance / 100,
+                                self._vol_knob_handle,
+                                self._vol_knob_active_handle,
+                                focus == self.FOCUS_BALANCE)
         else:
-            sel_color = (c("accent")
+            self.progress.draw(pager, c.progress_bg,
+                              c.progress_fill, c.progress_knob,
+                              c.text_dim, skin.font("label"))
+            self.volume.draw(pager, c.volume_bg, c.volume_fill,
+                            c.text_dim, skin.font("label"))
+
+        # --- Transport icons (sprite skins have them in the background) ---
+        if not bg_buttons:
+            sel_color = (c.accent
                          if self._focus == self.FOCUS_TRANSPORT
                          else None)
-            self.transport.draw(pager, c("transport"),
-                               c("transport_active"), sel_color,
+            self.transport.draw(pager, c.transport,
+                               c.transport_active, sel_color,
                                bg_has_buttons=False)
 
         # --- Active/toggled button sprites ---
+        shuffle = self.playlist.shuffle
+        repeat = self.playlist.repeat
         if bg_buttons and self._focus == self.FOCUS_TRANSPORT:
             idx = self._btn_index
-            if idx < len(self._active_sprite_info):
-                fname, ax, ay = self._active_sprite_info[idx]
-                if idx == 6 and self.playlist.shuffle:
-                    th = self._toggle_handles.get(
-                        "shuffle-active-toggled.png")
-                    if th:
-                        pager.draw_image(ax, ay, th)
-                    elif self._active_handles[idx]:
-                        pager.draw_image(ax, ay,
-                                        self._active_handles[idx])
-                elif idx == 7 and self.playlist.repeat != 0:
-                    th = self._toggle_handles.get(
-                        "repeat-active-toggled.png")
-                    if th:
-                        pager.draw_image(ax, ay, th)
-                    elif self._active_handles[idx]:
-                        pager.draw_image(ax, ay,
-                                        self._active_handles[idx])
-                elif self._active_handles[idx]:
-                    pager.draw_image(ax, ay,
-                                    self._active_handles[idx])
+            if idx < len(self._sprite_lut):
+                pager.draw_image(self._active_x[idx], self._active_y[idx],
+                                 self._resolve_sprite(idx, shuffle, repeat))
 
         # --- Shuffle/repeat toggle overlays ---
         if bg_buttons:
-            is_shuf_sel = (self._focus == self.FOCUS_TRANSPORT
-                           and self._btn_index == 6)
-            is_rep_sel = (self._focus == self.FOCUS_TRANSPORT
-                          and self._btn_index == 7)
-            if self.playlist.shuffle and not is_shuf_sel:
-                th = self._toggle_handles.get("shuffle-toggled.png")
-                if th:
-                    pager.draw_image(279, 178, th)
-            if self.playlist.repeat != 0 and not is_rep_sel:
-                th = self._toggle_handles.get("repeat-toggled.png")
-                if th:
-                    pager.draw_image(369, 178, th)
+            sel = (self._btn_index if self._focus == self.FOCUS_TRANSPORT
+                   else -1)
+            shuf_h, rep_h = self._overlay_handles
+            for idx, handle, on, x, y in (
+                    (6, shuf_h, shuffle, 279, 178),
+                    (7, rep_h, repeat != 0, 369, 178)):
+                if on and idx != sel:
+                    pager.draw_image(x, y, handle)
         else:
             sx, sy, sw, sh = self._shuffle_box
-            sc = (c("shuffle_on") if self.playlist.shuffle
-                  else c("shuffle_off"))
+            sc = (c.shuffle_on if self.playlist.shuffle
+                  else c.shuffle_off)
             pager.draw_ttf(sx + 2, sy + 2, "SHF", sc, FONT_PATH, 10)
             rx, ry, rw, rh = self._repeat_box
-            rc = (c("repeat_on") if self.playlist.repeat != 0
-                  else c("repeat_off"))
+            rc = (c.repeat_on if self.playlist.repeat != 0
+                  else c.repeat_off)
             rl = "RPT:" + self.playlist.repeat_label
             pager.draw_ttf(rx + 2, ry + 2, rl, rc, FONT_PATH, 10)
 
-        # Separator (fallback when no bg)
-        if skin.style == "classic" and not has_bg:
-            pager.hline(0, 23, SCREEN_W, c("separator"))
+        # --- Temporary value overlay (volume % / balance L-R) ---
+        # Drawn after the sprites so it stays on top of them.
+        if now < self._vol_show_until:
+            vol_text = "VOL: %d%%" % self.volume.level
+            tw = _measure(pager, vol_text, 16)
+            ox = ((SCREEN_W - tw) // 2) & ~1
+            oy = 78
+            pager.fill_rect(ox - 6, oy - 4, tw + 12, 24, c.title_bar_bg)
+            pager.draw_ttf(ox, oy, vol_text, c.title_bar_text, FONT_PATH, 16)
+        if now < self._bal_show_until:
+            if self._balance == 50:
+                bal_text = "BAL: CENTER"
+            elif self._balance < 50:
+                bal_text = "BAL: %dL" % (50 - self._balance)
+            else:
+                bal_text = "BAL: %dR" % (self._balance - 50)
+            tw = _measure(pager, bal_text, 16)
+            ox = ((SCREEN_W - tw) // 2) & ~1
+            oy = 78
+            pager.fill_rect(ox - 6, oy - 4, tw + 12, 24, c.title_bar_bg)
+            pager.draw_ttf(ox, oy, bal_text, c.title_bar_text, FONT_PATH, 16)
 
 
 class PlaylistScreen:
@@ -719,68 +840,76 @@ class PlaylistScreen:
         self.client = client
         self.playlist = playlist
         self.track_list = TrackList(0, 24, SCREEN_W, SCREEN_H - 28, 12)
+        self._header_key = None
+        self._header_spans = ()
+        self._last_version = -1
+        self._handlers = {
+            BTN_UP: self._select_prev,
+            BTN_DOWN: self._select_next,
+            BTN_LEFT: self._page_up,
+            BTN_RIGHT: self._page_down,
+            BTN_A: self._play_selected,
+            BTN_B: lambda: "now_playing",
+        }
 
     def _sync_tracks(self):
-        """Sync track list with playlist."""
-        names = [self.playlist.track_name(i)
-                 for i in range(self.playlist.length)]
-        self.track_list.set_tracks(names)
-        idx = self.playlist.current_track_index()
+        """Sync track list with playlist; names only rebuild on change."""
+        playlist = self.playlist
+        if playlist.version != self._last_version:
+            self._last_version = playlist.version
+            self.track_list.set_tracks(
+                [playlist.track_name(i) for i in range(playlist.length)])
+        idx = playlist.current_track_index()
         if idx is not None:
             self.track_list.current_playing = idx
 
     def handle_input(self, button, event_type, pager):
-        BTN_A = 0x10
-        BTN_B = 0x20
-        BTN_UP = 0x01
-        BTN_DOWN = 0x02
-        BTN_LEFT = 0x04
-        BTN_RIGHT = 0x08
-
         if event_type != 1:
             return None
+        handler = self._handlers.get(button)
+        if handler:
+            return handler()
+        return None
 
-        if button == BTN_UP:
-            self.track_list.navigate(-1)
-        elif button == BTN_DOWN:
-            self.track_list.navigate(1)
-        elif button == BTN_LEFT:
-            self.track_list.page_up()
-        elif button == BTN_RIGHT:
-            self.track_list.page_down()
-        elif button == BTN_A:
-            # Jump to selected track
-            idx = self.track_list.selected
-            track = self.playlist.jump_to(idx)
-            if track:
-                self.client.play(track)
-            return "now_playing"
-        elif button == BTN_B:
-            return "now_playing"
+    def _select_prev(self):
+        self.track_list.navigate(-1)
 
-        return None
+    def _select_next(self):
+        self.track_list.navigate(1)
+
+    def _page_up(self):
+        self.track_list.page_up()
+
+    def _page_down(self):
+        self.track_list.page_down()
+
+    def _play_selected(self):
+        """Jump to the selected track and play it."""
+        track = self.playlist.jump_to(self.track_list.selected)
+        if track:
+            self.client.play(track)
+        return "now_playing"
 
     def update(self, status):
         self._sync_tracks()
 
     def draw(self, pager, skin):
         c = skin.color
-        pager.clear(c("bg"))
+        pager.clear(c(C.BG))
 
         # Header
-        pager.fill_rect(0, 0, SCREEN_W, 22, c("title_bar_bg"))
-        pager.draw_ttf(6, 2, "Playlist", c("title_bar_text"),
-                      FONT_PATH, skin.font("title"))
-
-        count = "%d tracks" % self.playlist.length
-        cw = pager.ttf_width(count, FONT_PATH, skin.font("title"))
-        pager.draw_ttf(SCREEN_W - cw - 6, 2, count,
-                      c("title_bar_text"), FONT_PATH, skin.font("title"))
+        pager.fill_rect(0, 0, SCREEN_W, 22, c(C.TITLE_BAR_BG))
+        key = (skin.name, self.playlist.length)
+        if key != self._header_key:
+            self._header_key = key
+            self._header_spans = _title_spans(
+                pager, skin, "Playlist", "%d tracks" % self.playlist.length)
+        _draw_spans(pager, self._header_spans)
 
         # Track list
-        self.track_list.draw(pager, c("progress_knob"), c("track_highlight"),
-                            c("title_bar_text"), c("track_number"),
-                            c("accent"))
+        self.track_list.draw(pager, c(C.PROGRESS_KNOB), c(C.TRACK_HIGHLIGHT),
+                            c(C.TITLE_BAR_TEXT), c(C.TRACK_NUMBER),
+                            c(C.ACCENT))
 
 
 class FileBrowserScreen:
@@ -797,6 +926,21 @@ class FileBrowserScreen:
         self.font_size = 12
         self.line_height = 18
         self.visible_count = (SCREEN_H - 28) // self.line_height
+        self._trunc_cache = {}  # (display name, font size) -> fitted text
+        self._header_key = None
+        self._header_spans = ()
+        self._parent_dir = None  # None at the root
+        self._header = "Browse: /"
+        self._music_paths = []        # playable files in entry order
+        self._entry_to_music_idx = {}  # entry index -> _music_paths index
+        self._handlers = {
+            BTN_UP: self._select_prev,
+            BTN_DOWN: self._select_next,
+            BTN_LEFT: self._page_up,
+            BTN_RIGHT: self._page_down,
+            BTN_A: self._activate,
+            BTN_B: self._go_up,
+        }
         self._scan_dir()
 
     def enter(self):
@@ -806,99 +950,118 @@ class FileBrowserScreen:
     def _scan_dir(self):
         """Scan current directory for files and subdirectories."""
         self.entries = []
+        self._music_paths = []
+        self._entry_to_music_idx = {}
         self.selected = 0
         self.scroll_offset = 0
 
-        # Add parent directory entry if not at root
+        # Path strings used by draw and BTN_B, worked out once per scan
         if self.current_dir != self.root_dir:
-            self.entries.append(("..", True,
-                                os.path.dirname(self.current_dir)))
-
-        if not os.path.isdir(self.current_dir):
-            return
+            self._parent_dir = os.path.dirname(self.current_dir)
+            self.entries.append(("..", True, self._parent_dir))
+        else:
+            self._parent_dir = None
+        rel = self.current_dir
+        if rel.startswith(self.root_dir):
+            rel = rel[len(self.root_dir):]
+        self._header = "Browse: " + (rel or "/")
 
+        # scandir gets the entry type from readdir, so there is no
+        # per-entry stat() on the SD card
         dirs = []
         files = []
-        for name in sorted(os.listdir(self.current_dir)):
-            full = os.path.join(self.current_dir, name)
-            if os.path.isdir(full):
-                dirs.append((name + "/", True, full))
-            elif name.lower().endswith((".mp3", ".wav", ".m3u")):
-                files.append((name, False, full))
+        try:
+            with os.scandir(self.current_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        continue
+                    if is_dir:
+                        dirs.append((name + "/", True, entry.path))
+                    elif name.lower().endswith((".mp3", ".wav", ".m3u")):
+                        files.append((name, False, entry.path))
+        except OSError:
+            return
 
+        dirs.sort(key=lambda e: e[0][:-1])  # by name, without the "/"
+        files.sort()
         self.entries.extend(dirs)
         self.entries.extend(files)
+        self._trunc_cache.clear()
 
-    def handle_input(self, button, event_type, pager):
-        BTN_A = 0x10
-        BTN_B = 0x20
-        BTN_UP = 0x01
-        BTN_DOWN = 0x02
-        BTN_LEFT = 0x04
-        BTN_RIGHT = 0x08
+        # Directory playlist for _load_dir_playlist (.m3u files excluded)
+        music = self._music_paths
+        for i in range(len(self.entries) - len(files), len(self.entries)):
+            path = self.entries[i][2]
+            if path.lower().endswith((".mp3", ".wav")):
+                self._entry_to_music_idx[i] = len(music)
+                music.append(path)
 
+    def handle_input(self, button, event_type, pager):
         if event_type != 1:
             return None
+        handler = self._handlers.get(button)
+        if handler:
+            return handler()
+        return None
 
-        if button == BTN_UP:
-            self.selected = max(0, self.selected - 1)
-            if self.selected < self.scroll_offset:
-                self.scroll_offset = self.selected
-        elif button == BTN_DOWN:
-            self.selected = min(len(self.entries) - 1, self.selected + 1)
-            if self.selected >= self.scroll_offset + self.visible_count:
-                self.scroll_offset = self.selected - self.visible_count + 1
-        elif button == BTN_LEFT:
-            # Page up
-            self.selected = max(0, self.selected - self.visible_count)
-            self.scroll_offset = max(0,
-                                     self.scroll_offset - self.visible_count)
-        elif button == BTN_RIGHT:
-            # Page down
-            self.selected = min(len(self.entries) - 1,
-                               self.selected + self.visible_count)
-            if self.selected >= self.scroll_offset + self.visible_count:
-                self.scroll_offset = self.selected - self.visible_count + 1
-        elif button == BTN_A:
-            if not self.entries:
-                return None
-            name, is_dir, path = self.entries[self.selected]
-            if is_dir:
-                self.current_dir = path
-                self._scan_dir()
-            elif path.lower().endswith(".m3u"):
-                # Load playlist and play first track
-                self.playlist.load_m3u(path)
-                track = self.playlist.current_track()
-                if track:
-                    self.client.play(track)
-                return "now_playing"
-            else:
-                # Play file — load entire directory as playlist
-                self._load_dir_playlist(path)
-                return "now_playing"
-        elif button == BTN_B:
-            if self.current_dir != self.root_dir:
-                self.current_dir = os.path.dirname(self.current_dir)
-                self._scan_dir()
-            else:
-                return "now_playing"
+    def _select_prev(self):
+        self.selected = max(0, self.selected - 1)
+        if self.selected < self.scroll_offset:
+            self.scroll_offset = self.selected
+
+    def _select_next(self):
+        self.selected = min(len(self.entries) - 1, self.selected + 1)
+        if self.selected >= self.scroll_offset + self.visible_count:
+            self.scroll_offset = self.selected - self.visible_count + 1
+
+    def _page_up(self):
+        self.selected = max(0, self.selected - self.visible_count)
+        self.scroll_offset = max(0, self.scroll_offset - self.visible_count)
+
+    def _page_down(self):
+        self.selected = min(len(self.entries) - 1,
+                            self.selected + self.visible_count)
+        if self.selected >= self.scroll_offset + self.visible_count:
+            self.scroll_offset = self.selected - self.visible_count + 1
+
+    def _activate(self):
+        """Open the selected directory or play the selected file."""
+        if not self.entries:
+            return None
+        name, is_dir, path = self.entries[self.selected]
+        if is_dir:
+            self.current_dir = path
+            self._scan_dir()
+            return None
+        if path.lower().endswith(".m3u"):
+            # Load playlist and play first track
+            self.playlist.load_m3u(path)
+            track = self.playlist.current_track()
+            if track:
+                self.client.play(track)
+        else:
+            # Play file — load entire directory as playlist
+            self._load_dir_playlist()
+        return "now_playing"
 
+    def _go_up(self):
+        if self._parent_dir is None:
+            return "now_playing"
+        self.current_dir = self._parent_dir
+        self._scan_dir()
         return None
 
-    def _load_dir_playlist(self, selected_file):
+    def _load_dir_playlist(self):
         """Load all music files in current dir as playlist, starting at selected."""
-        files = [e[2] for e in self.entries if not e[1] and
-                 e[2].lower().endswith((".mp3", ".wav"))]
+        files = self._music_paths
         if not files:
             return
         self.playlist.load_files(files)
-        # Find and jump to selected file
-        try:
-            idx = files.index(selected_file)
-            self.playlist.jump_to(idx)
-        except ValueError:
-            idx = 0
+        idx = self._entry_to_music_idx.get(self.selected, 0)
+        self.playlist.jump_to(idx)
         self.client.play(files[idx])
 
     def update(self, status):
@@ -906,50 +1069,53 @@ class FileBrowserScreen:
 
     def draw(self, pager, skin):
         c = skin.color
-        pager.clear(c("bg"))
+        pager.clear(c(C.BG))
 
         # Header
-        pager.fill_rect(0, 0, SCREEN_W, 22, c("title_bar_bg"))
+        pager.fill_rect(0, 0, SCREEN_W, 22, c(C.TITLE_BAR_BG))
 
         # Show relative path
-        rel = self.current_dir
-        if rel.startswith(self.root_dir):
-            rel = rel[len(self.root_dir):]
-        if not rel:
-            rel = "/"
-        header = "Browse: " + rel
-        pager.draw_ttf(6, 2, header, c("title_bar_text"),
-                      FONT_PATH, skin.font("title"))
+        key = (skin.name, self._header)
+        if key != self._header_key:
+            self._header_key = key
+            self._header_spans = _title_spans(pager, skin, self._header)
+        _draw_spans(pager, self._header_spans)
 
         # File list
+        col_hl = c(C.TRACK_HIGHLIGHT)
+        col_sel = c(C.TITLE_BAR_TEXT)
+        col_txt = c(C.PROGRESS_KNOB)
+        fs = self.font_size
+        line_h = self.line_height
+        entries = self.entries
+        trunc_cache = self._trunc_cache
         for i in range(self.visible_count):
             idx = self.scroll_offset + i
-            if idx >= len(self.entries):
+            if idx >= len(entries):
                 break
 
-            name, is_dir, path = self.entries[idx]
-            ty = 26 + i * self.line_height
+            name, is_dir, path = entries[idx]
+            ty = 26 + i * line_h
             is_sel = (idx == self.selected)
 
             if is_sel:
-                pager.fill_rect(0, ty, SCREEN_W, self.line_height - 1,
-                               c("track_highlight"))
+                pager.fill_rect(0, ty, SCREEN_W, line_h - 1, col_hl)
 
-            tc = c("title_bar_text") if is_sel else c("progress_knob")
+            tc = col_sel if is_sel else col_txt
             if is_dir:
                 icon = "[D] " if name != ".." else " <- "
             else:
                 icon = "    "
 
             display_name = icon + name
-            # Truncate
-            max_w = SCREEN_W - 16
-            while (pager.ttf_width(display_name, FONT_PATH, self.font_size)
-                   > max_w and len(display_name) > 5):
-                display_name = display_name[:-1]
+            key = (display_name, fs)
+            fitted = trunc_cache.get(key)
+            if fitted is None:
+                fitted = _fit_text(pager, display_name, SCREEN_W - 16, fs, 5)
+                trunc_cache[key] = fitted
+            display_name = fitted
 
-            pager.draw_ttf(4, ty + 1, display_name, tc,
-                          FONT_PATH, self.font_size)
+            pager.draw_ttf(4, ty + 1, display_name, tc, FONT_PATH, fs)
 
 
 class SettingsScreen:
@@ -966,6 +1132,14 @@ class SettingsScreen:
         self.selected = 0
         self.font_size = 14
         self.line_height = 24
+        self._header_key = None
+        self._header_spans = ()
+        self._handlers = {
+            BTN_UP: self._select_prev,
+            BTN_DOWN: self._select_next,
+            BTN_A: self._activate,
+            BTN_B: lambda: "now_playing",
+        }
         self._build_items()
 
     def set_pager(self, pager):
@@ -973,8 +1147,10 @@ class SettingsScreen:
         self.pager = pager
 
     def _build_items(self):
+        """Build the rows once; callable values are read at draw time."""
         self.items = [
-            ("Theme", self.skin_manager.current_name, self._cycle_theme),
+            ("Theme", lambda: self.skin_manager.current_name,
+             self._cycle_theme),
             ("Brightness",
              lambda: "%d%%" % self.settings.get("brightness", 100),
              self._cycle_brightness),
@@ -982,9 +1158,9 @@ class SettingsScreen:
              self._toggle_shuffle),
             ("Repeat", lambda: self.playlist.repeat_label,
              self._cycle_repeat),
-            ("Bluetooth", lambda: "Setup >>", None),
-            ("Browse Files", lambda: ">>", None),
-            ("Exit PagerAmp", lambda: "", None),
+            ("Bluetooth", "Setup >>", None),
+            ("Browse Files", ">>", None),
+            ("Exit PagerAmp", "", None),
         ]
 
     def _cycle_theme(self):
@@ -1011,58 +1187,62 @@ class SettingsScreen:
             self.pager.set_brightness(val)
 
     def handle_input(self, button, event_type, pager):
-        BTN_A = 0x10
-        BTN_B = 0x20
-        BTN_UP = 0x01
-        BTN_DOWN = 0x02
-
         if event_type != 1:
             return None
+        handler = self._handlers.get(button)
+        if handler:
+            return handler()
+        return None
 
-        if button == BTN_UP:
-            self.selected = (self.selected - 1) % len(self.items)
-        elif button == BTN_DOWN:
-            self.selected = (self.selected + 1) % len(self.items)
-        elif button == BTN_A:
-            label = self.items[self.selected][0]
-            action = self.items[self.selected][2]
-            if action:
-                action()
-            elif label == "Bluetooth":
-                return "bluetooth"
-            elif label == "Browse Files":
-                return "browser"
-            elif label == "Exit PagerAmp":
-                return "exit"
-        elif button == BTN_B:
-            return "now_playing"
+    def _select_prev(self):
+        self.selected = (self.selected - 1) % len(self.items)
+
+    def _select_next(self):
+        self.selected = (self.selected + 1) % len(self.items)
 
+    def _activate(self):
+        label, _, action = self.items[self.selected]
+        if action:
+            action()
+        elif label == "Bluetooth":
+            return "bluetooth"
+        elif label == "Browse Files":
+            return "browser"
+        elif label == "Exit PagerAmp":
+            return "exit"
         return None
 
     def update(self, status):
-        self._build_items()
+        pass
 
     def draw(self, pager, skin):
         c = skin.color
-        pager.clear(c("bg"))
+        pager.clear(c(C.BG))
 
         # Header
-        pager.fill_rect(0, 0, SCREEN_W, 22, c("title_bar_bg"))
-        pager.draw_ttf(6, 2, "Settings", c("title_bar_text"),
-                      FONT_PATH, skin.font("title"))
+        pager.fill_rect(0, 0, SCREEN_W, 22, c(C.TITLE_BAR_BG))
+        if skin.name != self._header_key:
+            self._header_key = skin.name
+            self._header_spans = _title_spans(pager, skin, "Settings")
+        _draw_spans(pager, self._header_spans)
 
         # Menu items
+        col_hl = c(C.TRACK_HIGHLIGHT)
+        col_sel = c(C.TITLE_BAR_TEXT)
+        col_txt = c(C.PROGRESS_KNOB)
+        col_accent = c(C.ACCENT)
+        fs = self.font_size
+        line_h = self.line_height
         y = 28
         for i, (label, value_fn, _) in enumerate(self.items):
             is_sel = (i == self.selected)
 
             if is_sel:
-                pager.fill_rect(0, y, SCREEN_W, self.line_height - 1,
-                               c("track_highlight"))
+                pager.fill_rect(0, y, SCREEN_W, line_h - 1, col_hl)
 
-            tc = c("title_bar_text") if is_sel else c("progress_knob")
+            tc = col_sel if is_sel else col_txt
 
-            pager.draw_ttf(8, y + 3, label, tc, FONT_PATH, self.font_size)
+            pager.draw_ttf(8, y + 3, label, tc, FONT_PATH, fs)
 
             # Value on right side
             if callable(value_fn):
@@ -1070,12 +1250,12 @@ class SettingsScreen:
             else:
                 val = value_fn
             if val:
-                vw = pager.ttf_width(val, FONT_PATH, self.font_size)
-                vc = c("accent") if is_sel else c("progress_knob")
+                vw = pager.ttf_width(val, FONT_PATH, fs)
+                vc = col_accent if is_sel else col_txt
                 pager.draw_ttf(SCREEN_W - vw - 12, y + 3, val, vc,
-                              FONT_PATH, self.font_size)
+                               FONT_PATH, fs)
 
-            y += self.line_height
+            y += line_h
 
 
 class MenuOverlay:
@@ -1099,27 +1279,29 @@ class MenuOverlay:
             "Bluetooth": "bluetooth",
             "Exit PagerAmp": "exit",
         }
+        self._handlers = {
+            BTN_UP: self._select_prev,
+            BTN_DOWN: self._select_next,
+            BTN_A: self._activate,
+            BTN_B: lambda: "close_menu",
+        }
 
     def handle_input(self, button, event_type, pager):
-        BTN_A = 0x10
-        BTN_B = 0x20
-        BTN_UP = 0x01
-        BTN_DOWN = 0x02
-
         if event_type != 1:
             return None
+        handler = self._handlers.get(button)
+        if handler:
+            return handler()
+        return None
 
-        if button == BTN_UP:
-            self.selected = (self.selected - 1) % len(self.items)
-        elif button == BTN_DOWN:
-            self.selected = (self.selected + 1) % len(self.items)
-        elif button == BTN_A:
-            return self._target_map.get(self.items[self.selected],
-                                        "now_playing")
-        elif button == BTN_B:
-            return "close_menu"
+    def _select_prev(self):
+        self.selected = (self.selected - 1) % len(self.items)
 
-        return None
+    def _select_next(self):
+        self.selected = (self.selected + 1) % len(self.items)
+
+    def _activate(self):
+        return self._target_map.get(self.items[self.selected], "now_playing")
 
     def draw(self, pager, skin):
         c = skin.color
@@ -1131,17 +1313,20 @@ class MenuOverlay:
         my = (SCREEN_H - menu_h) // 2
 
         # Background box
-        pager.fill_rect(mx, my, menu_w, menu_h, c("menu_bg"))
-        pager.rect(mx, my, menu_w, menu_h, c("separator"))
+        pager.fill_rect(mx, my, menu_w, menu_h, c(C.MENU_BG))
+        pager.rect(mx, my, menu_w, menu_h, c(C.SEPARATOR))
 
         # Items
+        col_sel = c(C.TITLE_BAR_TEXT)
+        col_txt = c(C.PROGRESS_KNOB)
+        fs = self.font_size
+        line_h = self.line_height
         y = my + 6
         for i, item in enumerate(self.items):
             is_sel = (i == self.selected)
             if is_sel:
-                pager.fill_rect(mx + 1, y, menu_w - 2,
-                               self.line_height - 2, c("track_highlight"))
-            tc = c("title_bar_text") if is_sel else c("progress_knob")
-            pager.draw_ttf(mx + 16, y + 4, item, tc,
-                          FONT_PATH, self.font_size)
-            y += self.line_height
+                pager.fill_rect(mx + 1, y, menu_w - 2, line_h - 2,
+                               c(C.TRACK_HIGHLIGHT))
+            tc = col_sel if is_sel else col_txt
+            pager.draw_ttf(mx + 16, y + 4, item, tc, FONT_PATH, fs)
+            y += line_h
@@ -7,15 +7,24 @@ Colors stored as RGB565 for direct use with pagerctl.
 
 import os
 import json
+from functools import lru_cache
+
+
+# Per-channel RGB565 contributions, indexed by the 8-bit channel value
+_R5 = tuple((r & 0xF8) << 8 for r in range(256))
+_G6 = tuple((g & 0xFC) << 3 for g in range(256))
+_B5 = tuple(b >> 3 for b in range(256))
 
 
 def _rgb_to_565(r, g, b):
-    """Convert 8-bit RGB to RGB565."""
-    return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+    """Convert 8-bit RGB (0-255 each) to RGB565."""
+    return _R5[r] | _G6[g] | _B5[b]
 
 
+@lru_cache(maxsize=256)
 def _hex_to_565(hex_color):
-    """Convert '#RRGGBB' or '0xRRGGBB' to RGB565."""
+    """Convert '#RRGGBB' or '0xRRGGBB' to RGB565. Memoized: skins
+    share most of their color strings."""
     if isinstance(hex_color, int):
         r = (hex_color >> 16) & 0xFF
         g = (hex_color >> 8) & 0xFF
@@ -65,6 +74,52 @@ DEFAULT_ELEMENTS = {
 }
 
 
+class C:
+    """Color element IDs for Skin.color(), in DEFAULT_ELEMENTS order."""
+    BG = 0
+    TEXT = 1
+    TEXT_DIM = 2
+    TITLE_BAR_BG = 3
+    TITLE_BAR_TEXT = 4
+    TIME = 5
+    PROGRESS_BG = 6
+    PROGRESS_FILL = 7
+    PROGRESS_KNOB = 8
+    VOLUME_BG = 9
+    VOLUME_FILL = 10
+    TRANSPORT = 11
+    TRANSPORT_ACTIVE = 12
+    TRACK_HIGHLIGHT = 13
+    TRACK_HIGHLIGHT_TEXT = 14
+    TRACK_TEXT = 15
+    TRACK_NUMBER = 16
+    SHUFFLE_ON = 17
+    SHUFFLE_OFF = 18
+    REPEAT_ON = 19
+    REPEAT_OFF = 20
+    MENU_BG = 21
+    MENU_SELECTED = 22
+    MENU_TEXT = 23
+    SEPARATOR = 24
+    ACCENT = 25
+    WARNING = 26
+    INFO = 27
+
+
+# Element names in ID order, and name -> ID for JSON loading
+_COLOR_NAMES = tuple(DEFAULT_ELEMENTS)
+_COLOR_INDEX = {name: i for i, name in enumerate(_COLOR_NAMES)}
+
+# DEFAULT_ELEMENTS already converted, copied into every skin
+_DEFAULT_565 = tuple(_hex_to_565(DEFAULT_ELEMENTS[name])
+                     for name in _COLOR_NAMES)
+
+
+def color_id(name):
+    """C.* ID for a color element name."""
+    return _COLOR_INDEX[name]
+
+
 class Skin:
     """Theme/skin with color, font, layout, and sprite lookups."""
 
@@ -83,7 +138,7 @@ class Skin:
             "status": 12,
             "browser": 12,
         }
-        self._colors = {}
+        self._colors = []
         self._raw = {}
         self._layout = {}
         self._sprites = {}
@@ -94,8 +149,7 @@ class Skin:
             self._load_defaults()
 
     def _load_defaults(self):
-        for name, hex_val in DEFAULT_ELEMENTS.items():
-            self._colors[name] = _hex_to_565(hex_val)
+        self._colors = list(_DEFAULT_565)
 
     def _load(self, data, skins_dir=None):
         self.name = data.get("name", "Custom")
@@ -104,11 +158,11 @@ class Skin:
 
         # Load colors with fallback to defaults
         colors = data.get("colors", {})
-        for name, default_hex in DEFAULT_ELEMENTS.items():
-            if name in colors:
-                self._colors[name] = _hex_to_565(colors[name])
-            else:
-                self._colors[name] = _hex_to_565(default_hex)
+        self._colors = list(_DEFAULT_565)
+        for name, value in colors.items():
+            idx = _COLOR_INDEX.get(name)
+            if idx is not None:
+                self._colors[idx] = _hex_to_565(value)
 
         # Load font sizes with fallback
         fonts = data.get("fonts", {})
@@ -128,9 +182,9 @@ class Skin:
         self._layout = data.get("layout", {})
         self._sprites = data.get("sprites", {})
 
-    def color(self, name):
-        """Get RGB565 color by element name."""
-        return self._colors.get(name, 0xFFFF)
+    def color(self, idx):
+        """Get RGB565 color by element ID (a C.* constant)."""
+        return self._colors[idx]
 
     def font(self, element):
         """Get font size for an element."""
@@ -152,79 +206,132 @@ class Skin:
 
 
 class SkinManager:
-    """Loads and manages available skins."""
+    """Finds available skins and loads each one on first use."""
 
     def __init__(self, skins_dir=None):
         if skins_dir is None:
             skins_dir = os.path.join(os.path.dirname(os.path.dirname(
                 os.path.abspath(__file__))), "skins")
         self.skins_dir = skins_dir
-        self.skins = {}  # name → Skin
-        self.skin_names = []
+        self.skins = {}  # name → Skin, for the skins parsed so far
+        self.skin_names = []  # theme folder name until parsed, then name
+        self._pending = []  # (config paths, theme folder); None if parsed
         self.current_index = 0
         self._load_all()
 
     def _load_all(self):
-        """Load skins from subdirectories of skins_dir.
+        """Find skin configs in subdirectories of skins_dir.
 
         Each theme is a subfolder containing a .json config and all
         assets (background PNG, button sprites, knob sprites, etc.).
         To create a new theme, copy an existing folder and modify.
+        Configs are only located here; _ensure_loaded() parses them.
         """
-        if not os.path.isdir(self.skins_dir):
-            self.skins["Default"] = Skin()
-            self.skin_names = ["Default"]
-            return
-
-        for entry in sorted(os.listdir(self.skins_dir)):
-            subdir = os.path.join(self.skins_dir, entry)
-            if not os.path.isdir(subdir):
-                continue
+        try:
+            with os.scandir(self.skins_dir) as it:
+                subdirs = sorted((e.name, e.path) for e in it if e.is_dir())
+        except OSError:
+            subdirs = []
+
+        for entry, subdir in subdirs:
             # Find the .json config in this theme folder
-            for fname in sorted(os.listdir(subdir)):
-                if not fname.endswith(".json"):
-                    continue
-                path = os.path.join(subdir, fname)
-                try:
-                    with open(path, "r") as f:
-                        data = json.load(f)
-                    skin = Skin(data, skins_dir=subdir)
-                    self.skins[skin.name] = skin
-                    self.skin_names.append(skin.name)
-                except (IOError, json.JSONDecodeError, ValueError):
-                    continue
-                break  # One config per theme folder
-
-        if not self.skins:
-            self.skins["Default"] = Skin()
-            self.skin_names = ["Default"]
+            try:
+                configs = sorted(f for f in os.listdir(subdir)
+                                 if f.endswith(".json"))
+            except OSError:
+                continue
+            if configs:
+                self.skin_names.append(entry)
+                self._pending.append(
+                    ([os.path.join(subdir, f) for f in configs], subdir))
+
+        if not self.skin_names:
+            self._use_default()
+
+    def _use_default(self):
+        self.skins = {"Default": Skin()}
+        self.skin_names = ["Default"]
+        self._pending = [None]
+        self.current_index = 0
+
+    def _ensure_loaded(self, index):
+        """Parse the skin at index if needed and return it.
+
+        The folder's .json files are tried in order and the first that
+        loads is used (one config per theme folder). If none load, the
+        folder is dropped from the list (later entries shift down,
+        current_index with them) and None is returned.
+        """
+        pending = self._pending[index]
+        if pending is None:
+            return self.skins[self.skin_names[index]]
+        paths, subdir = pending
+        skin = None
+        for path in paths:
+            try:
+                with open(path, "r") as f:
+                    data = json.load(f)
+                skin = Skin(data, skins_dir=subdir)
+                break
+            except (IOError, OSError, ValueError):
+                continue
+        if skin is None:
+            del self.skin_names[index]
+            del self._pending[index]
+            if index < self.current_index:
+                self.current_index -= 1
+            if not self.skin_names:
+                self._use_default()
+            return None
+        self.skins[skin.name] = skin
+        self.skin_names[index] = skin.name
+        self._pending[index] = None
+        return skin
+
+    def _select(self, index, step=1):
+        """Make index current, moving by step past skins that fail."""
+        while True:
+            index %= len(self.skin_names)
+            skin = self._ensure_loaded(index)
+            if skin is not None:
+                self.current_index = index
+                return skin
+            if step < 0:
+                index -= 1
 
     @property
     def current(self):
         """Get the currently active skin."""
-        if self.current_index < len(self.skin_names):
-            return self.skins[self.skin_names[self.current_index]]
-        return Skin()
+        return self._select(self.current_index)
 
     def next_skin(self):
         """Cycle to next skin, returns new skin."""
-        self.current_index = (self.current_index + 1) % len(self.skin_names)
-        return self.current
+        return self._select(self.current_index + 1)
 
     def prev_skin(self):
         """Cycle to previous skin."""
-        self.current_index = (self.current_index - 1) % len(self.skin_names)
-        return self.current
+        return self._select(self.current_index - 1, -1)
 
     def set_skin(self, name):
-        """Set skin by name."""
+        """Set skin by name, parsing configs in order until it is found.
+
+        Names live inside the configs, so a name that matches no skin
+        (e.g. a saved theme that was deleted) parses every config.
+        """
         if name in self.skins:
-            self.current_index = self.skin_names.index(name)
-            return self.current
+            return self._select(self.skin_names.index(name))
+        i = 0
+        while i < len(self.skin_names):
+            if self._pending[i] is not None:
+                skin = self._ensure_loaded(i)
+                if skin is None:
+                    continue  # dropped; the next entry is now at i
+                if skin.name == name:
+                    self.current_index = i
+                    return skin
+            i += 1
         return None
 
     @property
     def current_name(self):
-        if self.current_index < len(self.skin_names):
-            return self.skin_names[self.current_index]
-        return "Default"
+        return self.current.name
@@ -7,6 +7,7 @@ Display is 480x222 RGB565 landscape.
 
 import time
 import os
+from functools import lru_cache
 
 # Font path (resolved at import)
 FONT_DIR = os.path.join(os.path.dirname(os.path.dirname(
@@ -14,6 +15,35 @@ FONT_DIR = os.path.join(os.path.dirname(os.path.dirname(
 FONT_PATH = os.path.join(FONT_DIR, "DejaVuSansMono.ttf")
 
 
+@lru_cache(maxsize=256)
+def _measure(pager, text, font_size):
+    """Width of text in FONT_PATH at font_size, cached.
+
+    Widths depend only on the string, font and size, so the FreeType
+    measurement for labels redrawn every frame is done once.
+    """
+    return pager.ttf_width(text, FONT_PATH, font_size)
+
+
+def _fit_text(pager, text, max_w, font_size, min_len=0):
+    """Longest prefix of text (at least min_len chars) that fits max_w.
+
+    Binary search over prefix lengths: O(log n) FreeType measurements
+    instead of one per dropped character.
+    """
+    if (len(text) <= min_len
+            or pager.ttf_width(text, FONT_PATH, font_size) <= max_w):
+        return text
+    lo, hi = min_len, len(text) - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if pager.ttf_width(text[:mid], FONT_PATH, font_size) <= max_w:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo]
+
+
 class ScrollText:
     """Horizontally scrolling text for long titles."""
 
@@ -31,17 +61,29 @@ class ScrollText:
         self.PAUSE_AT_END = 20
         self._needs_scroll = False
         self._last_text = None
+        self._width_pending = False
 
-    def set_text(self, text, pager):
-        """Update text and recalculate width."""
+    def set_text(self, text, pager=None):
+        """Update text and recalculate width. Without a pager the width
+        is measured by the next draw()."""
         if text == self._last_text:
             return
         self._last_text = text
         self.text = text
         self.offset = 0
         self.pause_frames = self.PAUSE_AT_START
-        self.text_width = pager.ttf_width(text, FONT_PATH, self.font_size)
+        if pager is None:
+            self.text_width = 0
+            self._needs_scroll = False
+            self._width_pending = True
+        else:
+            self._measure(pager)
+
+    def _measure(self, pager):
+        self.text_width = pager.ttf_width(self.text, FONT_PATH,
+                                          self.font_size)
         self._needs_scroll = self.text_width > self.max_width
+        self._width_pending = False
 
     def update(self):
         """Advance scroll animation."""
@@ -58,20 +100,6 @@ class ScrollText:
             self.offset = 0
             self.pause_frames = self.PAUSE_AT_START
 
-    def _fit_text(self, pager, text, max_px):
-        """Truncate text to fit within max_px pixels."""
-        if pager.ttf_width(text, FONT_PATH, self.font_size) <= max_px:
-            return text
-        # Binary search for the longest substring that fits
-        lo, hi = 0, len(text)
-        while lo < hi:
-            mid = (lo + hi + 1) // 2
-            if pager.ttf_width(text[:mid], FONT_PATH, self.font_size) <= max_px:
-                lo = mid
-            else:
-                hi = mid - 1
-        return text[:lo]
-
     def _draw_clipped(self, pager, text, tx, color):
         """Draw text at tx, clipped to [self.x, self.x + max_width]."""
         right_edge = self.x + self.max_width
@@ -97,7 +125,7 @@ class ScrollText:
             draw_x = self.x
         # Right clipping: truncate to fit within remaining width
         avail = right_edge - draw_x
-        draw_text = self._fit_text(pager, draw_text, avail)
+        draw_text = _fit_text(pager, draw_text, avail, self.font_size)
         if draw_text:
             pager.draw_ttf(draw_x, self.y, draw_text, color,
                           FONT_PATH, self.font_size)
@@ -106,10 +134,13 @@ class ScrollText:
         """Draw the text, clipped to the title area."""
         if not self.text:
             return
+        if self._width_pending:
+            self._measure(pager)
 
         if not self._needs_scroll:
             # Static text — truncate to fit
-            clipped = self._fit_text(pager, self.text, self.max_width)
+            clipped = _fit_text(pager, self.text, self.max_width,
+                                self.font_size)
             pager.draw_ttf(self.x, self.y, clipped, color,
                           FONT_PATH, self.font_size)
             return
@@ -221,11 +252,13 @@ class TrackList:
         self.current_playing = -1  # currently playing index
         self.scroll_offset = 0    # first visible index
         self.visible_count = height // self.line_height
+        self._fit_cache = {}      # name -> name truncated to fit the row
 
     def set_tracks(self, names):
         if names == self.tracks:
             return
         self.tracks = names
+        self._fit_cache.clear()
         self.selected = max(0, min(self.selected, len(names) - 1))
         if self.scroll_offset > self.selected:
             self.scroll_offset = self.selected
@@ -252,6 +285,9 @@ class TrackList:
     def draw(self, pager, text_color, highlight_bg, highlight_text,
              number_color, playing_color=None):
         """Draw the visible portion of the track list."""
+        fs = self.font_size
+        max_name_w = self.width - 40
+        fit_cache = self._fit_cache
         for i in range(self.visible_count):
             idx = self.scroll_offset + i
             if idx >= len(self.tracks):
@@ -269,15 +305,15 @@ class TrackList:
             # Track number
             num_str = "%2d." % (idx + 1)
             nc = highlight_text if is_selected else number_color
-            pager.draw_ttf(self.x + 2, ty + 1, num_str, nc,
-                          FONT_PATH, self.font_size)
+            pager.draw_ttf(self.x + 2, ty + 1, num_str, nc, FONT_PATH, fs)
 
-            # Track name
+            # Track name, truncated if too long
             name = self.tracks[idx]
-            # Truncate if too long
-            max_name_w = self.width - 40
-            while pager.ttf_width(name, FONT_PATH, self.font_size) > max_name_w and len(name) > 1:
-                name = name[:-1]
+            fitted = fit_cache.get(name)
+            if fitted is None:
+                fitted = _fit_text(pager, name, max_name_w, fs, 1)
+                fit_cache[name] = fitted
+            name = fitted
 
             if is_selected:
                 tc = highlight_text
@@ -286,15 +322,14 @@ class TrackList:
             else:
                 tc = text_color
 
-            pager.draw_ttf(self.x + 30, ty + 1, name, tc,
-                          FONT_PATH, self.font_size)
+            pager.draw_ttf(self.x + 30, ty + 1, name, tc, FONT_PATH, fs)
 
             # Playing indicator
             if is_playing:
                 marker = ">"
                 mc = playing_color or highlight_text
                 pager.draw_ttf(self.x + self.width - 14, ty + 1, marker, mc,
-                              FONT_PATH, self.font_size)
+                              FONT_PATH, fs)
 
 
 class TransportIcons:
@@ -431,7 +466,13 @@ def _format_time(seconds):
     """Format seconds as M:SS or H:MM:SS."""
     if seconds < 0:
         seconds = 0
-    seconds = int(seconds)
+    return _format_secs(int(seconds))
+
+
+@lru_cache(maxsize=8192)
+def _format_secs(seconds):
+    """_format_time() for whole, non-negative seconds, memoized.
+    Positions arrive as floats, so the cache is keyed on the int."""
     if seconds >= 3600:
         h = seconds // 3600
         m = (seconds % 3600) // 60
@@ -9,15 +9,19 @@ Usage: python3 upload_server.py [--port PORT] [--dir MUSIC_DIR]
 """
 
 import os
+import re
 import sys
 import json
-import cgi
 import argparse
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import threading
+from contextlib import contextmanager
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 
 MUSIC_DIR = "/mmc/root/payloads/user/utilities/pageramp/music"
-ALLOWED_EXT = {".mp3", ".wav", ".m3u"}
+ALLOWED_EXT = (".mp3", ".wav", ".m3u")  # tuple for str.endswith
 MAX_UPLOAD_SIZE = 50 * 1024 * 1024  # 50MB
+COPY_CHUNK = 64 * 1024       # read size when streaming uploads
+WRITE_BUFFER = 1024 * 1024   # batch SD card writes into 1MB chunks
 
 # Log files available for download
 LOG_FILES = {
@@ -30,33 +34,83 @@ TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
                             "templates")
 
 
+_TEMPLATE_CACHE = None  # (html bytes, Content-Length string)
+
+
 def get_template():
-    """Load the HTML template."""
-    path = os.path.join(TEMPLATE_DIR, "index.html")
-    try:
-        with open(path, "r") as f:
-            return f.read()
-    except (IOError, OSError):
-        return "<html><body><h1>PagerAmp Upload</h1><p>Template not found.</p></body></html>"
+    """Load the HTML template once; returns (bytes, Content-Length)."""
+    global _TEMPLATE_CACHE
+    if _TEMPLATE_CACHE is None:
+        path = os.path.join(TEMPLATE_DIR, "index.html")
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except (IOError, OSError):
+            data = b"<html><body><h1>PagerAmp Upload</h1><p>Template not found.</p></body></html>"
+        _TEMPLATE_CACHE = (data, str(len(data)))
+    return _TEMPLATE_CACHE
 
 
 def list_music_files(music_dir):
     """List music files with sizes."""
     files = []
-    if not os.path.isdir(music_dir):
+    try:
+        with os.scandir(music_dir) as it:
+            entries = []
+            for entry in it:
+                if (entry.name.lower().endswith(ALLOWED_EXT)
+                        and entry.is_file()):
+                    entries.append(entry)
+    except OSError:
         return files
-    for name in sorted(os.listdir(music_dir)):
-        full = os.path.join(music_dir, name)
-        if os.path.isfile(full) and os.path.splitext(name)[1].lower() in ALLOWED_EXT:
-            size = os.path.getsize(full)
-            files.append({
-                "name": name,
-                "size": size,
-                "size_str": _format_size(size),
-            })
+    entries.sort(key=lambda e: e.name)
+    for entry in entries:
+        try:
+            size = entry.stat().st_size
+        except OSError:
+            continue  # deleted since the scan
+        files.append({
+            "name": entry.name,
+            "size": size,
+            "size_str": _format_size(size),
+        })
     return files
 
 
+_file_locks = {}  # name -> [lock, holders]; entries live while in use
+_file_locks_guard = threading.Lock()
+
+
+@contextmanager
+def _file_lock(name):
+    """Serialize uploads and deletes of one music file name.
+
+    The per-name entry is dropped when its last holder leaves, so
+    requests naming files that never existed do not accumulate locks.
+    """
+    with _file_locks_guard:
+        entry = _file_locks.get(name)
+        if entry is None:
+            entry = _file_locks[name] = [threading.Lock(), 0]
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        with _file_locks_guard:
+            entry[1] -= 1
+            if not entry[1]:
+                del _file_locks[name]
+
+
+def _remove_partial(path):
+    """Delete a file left half-written by a failed upload."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
 def _format_size(size):
     if size < 1024:
         return "%d B" % size
@@ -66,6 +120,105 @@ def _format_size(size):
         return "%.1f MB" % (size / (1024 * 1024))
 
 
+_BOUNDARY_RE = re.compile(r'boundary=(?:"([^"]+)"|([^;\s]+))', re.I)
+_DISPOSITION_NAME_RE = re.compile(r'\bname="([^"]*)"', re.I)
+_DISPOSITION_FILE_RE = re.compile(r'\bfilename="([^"]*)"', re.I)
+MAX_PART_HEADERS = 16 * 1024
+MAX_JSON_BODY = 4096  # API request bodies are a single small object
+# A bare file name: no path separators, control characters or leading dot
+_SAFE_NAME_RE = re.compile(r"[^./\\\x00-\x1f][^/\\\x00-\x1f]{0,254}")
+
+
+class MultipartReader:
+    """Streaming multipart/form-data reader.
+
+    Reads at most `length` bytes from `fp` in COPY_CHUNK pieces, so file
+    parts go straight to disk instead of being buffered in memory or a
+    temp file. parts() yields (name, filename) per part; consume the body
+    with copy_part() or leave it and it is skipped. Raises ValueError on
+    a malformed or truncated body.
+    """
+
+    def __init__(self, fp, boundary, length):
+        self._fp = fp
+        self._left = length
+        self._delim = b"\r\n--" + boundary
+        # Leading CRLF lets the first boundary match like the others
+        self._buf = bytearray(b"\r\n")
+        self._in_part = False
+
+    def _fill(self):
+        """Read more of the body into the buffer; False at the end."""
+        if self._left <= 0:
+            return False
+        chunk = self._fp.read(min(COPY_CHUNK, self._left))
+        if not chunk:
+            self._left = 0
+            return False
+        self._left -= len(chunk)
+        self._buf += chunk
+        return True
+
+    def parts(self):
+        self.skip_part()  # preamble before the first boundary
+        while True:
+            while len(self._buf) < 2:
+                if not self._fill():
+                    raise ValueError("body ended without closing boundary")
+            if self._buf[:2] == b"--":
+                return
+            while True:
+                end = self._buf.find(b"\r\n\r\n")
+                if end >= 0:
+                    break
+                if len(self._buf) > MAX_PART_HEADERS:
+                    raise ValueError("part headers too long")
+                if not self._fill():
+                    raise ValueError("body ended inside part headers")
+            headers = self._buf[:end].decode("utf-8", "replace")
+            del self._buf[:end + 4]
+            name = filename = None
+            for line in headers.split("\r\n"):
+                if line.lower().startswith("content-disposition:"):
+                    m = _DISPOSITION_NAME_RE.search(line)
+                    name = m.group(1) if m else None
+                    m = _DISPOSITION_FILE_RE.search(line)
+                    filename = m.group(1) if m else None
+            self._in_part = True
+            yield name, filename
+            if self._in_part:
+                self.skip_part()
+
+    def copy_part(self, write):
+        """Pass the current part's body to write() and move past it.
+
+        write() gets a memoryview into the read buffer rather than a
+        copied slice; it must not keep a reference once it returns.
+        """
+        delim = self._delim
+        keep = len(delim) - 1  # tail that may hold a split boundary
+        buf = self._buf
+        while True:
+            idx = buf.find(delim)
+            if idx >= 0:
+                if idx:
+                    with memoryview(buf)[:idx] as chunk:
+                        write(chunk)
+                del buf[:idx + len(delim)]
+                self._in_part = False
+                return
+            safe = len(buf) - keep
+            if safe > 0:
+                with memoryview(buf)[:safe] as chunk:
+                    write(chunk)
+                del buf[:safe]
+            if not self._fill():
+                raise ValueError("body ended inside a part")
+
+    def skip_part(self):
+        self.copy_part(lambda data: None)
+
+
 class UploadHandler(BaseHTTPRequestHandler):
     music_dir = MUSIC_DIR
 
@@ -93,11 +246,10 @@ class UploadHandler(BaseHTTPRequestHandler):
             self.send_error(404)
 
     def _serve_page(self):
-        html = get_template()
-        data = html.encode("utf-8")
+        data, length = get_template()
         self.send_response(200)
         self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Content-Length", length)
         self.end_headers()
         self.wfile.write(data)
 
@@ -116,85 +268,101 @@ class UploadHandler(BaseHTTPRequestHandler):
             self._json_response(400, {"error": "Must be multipart/form-data"})
             return
 
-        content_length = int(self.headers.get("Content-Length", 0))
+        m = _BOUNDARY_RE.search(content_type)
+        if not m:
+            self._json_response(400, {"error": "Missing multipart boundary"})
+            return
+        boundary = (m.group(1) or m.group(2)).encode("latin-1")
+
+        try:
+            content_length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            self._json_response(411, {"error": "Content-Length required"})
+            return
         if content_length > MAX_UPLOAD_SIZE:
             self._json_response(413, {"error": "File too large (max 50MB)"})
             return
 
-        # Parse multipart form
-        form = cgi.FieldStorage(
-            fp=self.rfile,
-            headers=self.headers,
-            environ={
-                "REQUEST_METHOD": "POST",
-                "CONTENT_TYPE": content_type,
-            }
-        )
-
         uploaded = []
         errors = []
 
-        # Handle single file or multiple files
-        file_items = form["file"] if "file" in form else []
-        if not isinstance(file_items, list):
-            file_items = [file_items]
-
         os.makedirs(self.music_dir, exist_ok=True)
 
-        for item in file_items:
-            if not hasattr(item, "filename") or not item.filename:
-                continue
-
-            filename = os.path.basename(item.filename)
-            ext = os.path.splitext(filename)[1].lower()
-
-            if ext not in ALLOWED_EXT:
-                errors.append("%s: unsupported format" % filename)
-                continue
-
-            # Sanitize filename
-            filename = filename.replace(" ", "_")
-            dest = os.path.join(self.music_dir, filename)
-
-            try:
-                with open(dest, "wb") as f:
-                    while True:
-                        chunk = item.file.read(8192)
-                        if not chunk:
-                            break
-                        f.write(chunk)
+        reader = MultipartReader(self.rfile, boundary, content_length)
+        try:
+            for name, filename in reader.parts():
+                # Only "file" fields with a file name; others are skipped
+                if name != "file" or not filename:
+                    continue
+
+                filename = os.path.basename(filename)
+
+                if not filename.lower().endswith(ALLOWED_EXT):
+                    errors.append("%s: unsupported format" % filename)
+                    continue
+
+                # Sanitize filename
+                filename = filename.replace(" ", "_")
+                dest = os.path.join(self.music_dir, filename)
+
+                # Stream into a temp name and swap it in only once the
+                # part is complete, so a failed re-upload keeps the old
+                # copy. The suffix keeps it out of the library listing.
+                tmp = dest + ".part"
+                with _file_lock(filename):
+                    try:
+                        with open(tmp, "wb", buffering=WRITE_BUFFER) as f:
+                            reader.copy_part(f.write)
+                        os.replace(tmp, dest)
+                    except (IOError, OSError) as e:
+                        errors.append("%s: %s" % (filename, str(e)))
+                        _remove_partial(tmp)
+                        continue
+                    except ValueError:
+                        _remove_partial(tmp)
+                        raise
                 uploaded.append(filename)
                 self.log_message("Uploaded: %s", filename)
-            except (IOError, OSError) as e:
-                errors.append("%s: %s" % (filename, str(e)))
+        except ValueError as e:
+            errors.append("Malformed upload: %s" % e)
 
         result = {"uploaded": uploaded, "errors": errors}
         self._json_response(200, result)
 
     def _handle_delete(self):
-        content_length = int(self.headers.get("Content-Length", 0))
-        body = self.rfile.read(content_length).decode("utf-8")
+        try:
+            content_length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            self._json_response(411, {"error": "Content-Length required"})
+            return
+        if content_length > MAX_JSON_BODY:
+            self._json_response(413, {"error": "Request too large"})
+            return
+        # json.loads accepts the UTF-8 bytes directly
+        body = self.rfile.read(max(content_length, 0))
         try:
             data = json.loads(body)
-        except (json.JSONDecodeError, ValueError):
+        except ValueError:
             self._json_response(400, {"error": "Invalid JSON"})
             return
 
-        filename = data.get("filename", "")
-        if not filename or "/" in filename or "\\" in filename:
+        filename = data.get("filename") if isinstance(data, dict) else None
+        if (not isinstance(filename, str)
+                or not _SAFE_NAME_RE.fullmatch(filename)):
             self._json_response(400, {"error": "Invalid filename"})
             return
 
         path = os.path.join(self.music_dir, filename)
-        if not os.path.isfile(path):
-            self._json_response(404, {"error": "File not found"})
-            return
+        with _file_lock(filename):
+            if not os.path.isfile(path):
+                self._json_response(404, {"error": "File not found"})
+                return
 
-        try:
-            os.remove(path)
-            self._json_response(200, {"deleted": filename})
-        except OSError as e:
-            self._json_response(500, {"error": str(e)})
+            try:
+                os.remove(path)
+                self._json_response(200, {"deleted": filename})
+            except OSError as e:
+                self._json_response(500, {"error": str(e)})
 
     def _serve_log_list(self):
         logs = []
@@ -240,7 +408,8 @@ class UploadHandler(BaseHTTPRequestHandler):
 
 def run_server(port=1337, music_dir=MUSIC_DIR):
     UploadHandler.music_dir = music_dir
-    server = HTTPServer(("0.0.0.0", port), UploadHandler)
+    # Threaded so library polls and deletes are answered mid-upload
+    server = ThreadingHTTPServer(("0.0.0.0", port), UploadHandler)
     sys.stderr.write("PagerAmp upload server on http://0.0.0.0:%d\n" % port)
     sys.stderr.write("Music directory: %s\n" % music_dir)
     try: